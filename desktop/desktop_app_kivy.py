@@ -4176,7 +4176,7 @@ class PangeaDesktopApp(MDApp):
                     # Send via Go streaming service
                     success = self.go_client.send_video_frame(
                         frame_id=frame_id,
-                        data=jpeg_data.tobytes(),
+                        data=jpeg_data,
                         width=VIDEO_WIDTH,
                         height=VIDEO_HEIGHT,
                         quality=VIDEO_JPEG_QUALITY,
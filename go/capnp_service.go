@@ -11,6 +11,7 @@ import (
 	"log"
 	"net"
 	"strings"
+	"sync"
 	"time"
 
 	"crypto/sha256"
@@ -888,29 +889,37 @@ func (s *nodeServiceServer) Download(ctx context.Context, call NodeService_downl
 	shardCount := shardLocationsList.Len()
 	log.Printf("Download requested for %d shard locations", shardCount)
 
-	// Fetch shards from peers
+	// Fetch shards from peers concurrently so download latency is bounded by
+	// the slowest peer rather than the sum of all round-trips. Each goroutine
+	// writes only its own slot, so no locking is needed.
 	shards := make([]ShardData, shardCount)
 	present := make([]bool, shardCount)
 
+	var wg sync.WaitGroup
 	for i := 0; i < shardCount; i++ {
 		loc := shardLocationsList.At(i)
 		shardIndex := loc.ShardIndex()
 		peerID := loc.PeerId()
 
-		// Fetch shard from peer using network layer
-		log.Printf("Fetching shard %d from peer %d", shardIndex, peerID)
-		shardData, err := s.network.FetchShard(peerID, shardIndex)
-		if err != nil {
-			log.Printf("Warning: Failed to fetch shard %d from peer %d: %v", shardIndex, peerID, err)
-			present[i] = false
-			shards[i] = ShardData{Data: nil}
-			continue
-		}
+		wg.Add(1)
+		go func(slot int, peerID, shardIndex uint32) {
+			defer wg.Done()
+
+			// Fetch shard from peer using network layer
+			log.Printf("Fetching shard %d from peer %d", shardIndex, peerID)
+			shardData, err := s.network.FetchShard(peerID, shardIndex)
+			if err != nil {
+				log.Printf("Warning: Failed to fetch shard %d from peer %d: %v", shardIndex, peerID, err)
+				shards[slot] = ShardData{Data: nil}
+				return
+			}
 
-		present[i] = true
-		shards[i] = ShardData{Data: shardData}
-		log.Printf("Successfully fetched shard %d (%d bytes)", shardIndex, len(shardData))
+			present[slot] = true
+			shards[slot] = ShardData{Data: shardData}
+			log.Printf("Successfully fetched shard %d (%d bytes)", shardIndex, len(shardData))
+		}(i, peerID, shardIndex)
 	}
+	wg.Wait()
 
 	// Check if we have enough shards to reconstruct
 	presentCount := 0
@@ -1,3 +1,4 @@
 from .go_client import GoNodeClient
+from .pool import GoNodeClientPool
 
-__all__ = ["GoNodeClient"]
+__all__ = ["GoNodeClient", "GoNodeClientPool"]
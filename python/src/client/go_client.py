@@ -3,15 +3,26 @@ Cap'n Proto RPC client for connecting to Go nodes.
 Provides easy-to-use functions for Python to interact with Go nodes.
 """
 
+import atexit
 import capnp
+import collections
+import concurrent.futures
+import functools
+import itertools
 import logging
+import os
 import threading
 import time
 import sys
 import asyncio
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, Union, Callable
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, Future
+
+try:
+    # orjson parses large chat histories several times faster than stdlib json
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore[no-redef]
 
 # Add parent directory for relative imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -20,15 +31,484 @@ from src.utils.paths import get_go_schema_path
 
 logger = logging.getLogger(__name__)
 
+# Bytes-like payloads accepted by the data-carrying methods (upload,
+# ces_process, send_message, send_video_frame, send_audio_chunk,
+# submit_compute_job).
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Fire-and-forget sends (sync=False) allowed in flight per client before
+# callers block, so a slow Go node cannot make the pending queue grow unbounded.
+_MAX_INFLIGHT_SENDS = 32
+
+# Seconds connect() and connect_async() wait for the Go node to accept
+_CONNECT_TIMEOUT = 5.0
+
+# Sequence suffix for ephemeral message ids, so messages sent within the same
+# second still get distinct ids
+_message_seq = itertools.count()
+
+# Compute job states after which the Go orchestrator no longer updates a job
+_COMPUTE_JOB_FINAL_STATES = frozenset({"completed", "failed", "timeout", "cancelled"})
+
+# Pending bytes at which _CoalescingTransport flushes without waiting for the
+# end of the event-loop iteration.
+_CAPNP_BUF_BYTES = 65536
+
+
+def _as_data(data: BytesLike) -> Any:
+    """
+    Return a value that can be assigned to a Cap'n Proto Data field.
+
+    pycapnp accepts bytes and memoryview but rejects bytearray, so other
+    buffers are wrapped in a byte-format memoryview instead of being copied
+    into a new bytes object first.
+    """
+    if isinstance(data, bytes):
+        return data
+    return memoryview(data).cast("B")
+
+
+class _CoalescingTransport:
+    """
+    Transport wrapper that merges the writes of one event-loop iteration.
+
+    pycapnp hands every piece of an outgoing message (segment table, then
+    each segment) to ``transport.write`` separately, and asyncio sends each
+    one immediately, so a small RPC costs two send() calls and, with
+    TCP_NODELAY, two TCP segments. Writes are buffered here and passed on
+    as one chunk at the end of the iteration, or as soon as
+    _CAPNP_BUF_BYTES are pending. Pipelined calls issued together share a
+    send as well.
+    """
+
+    def __init__(self, transport, loop: asyncio.AbstractEventLoop):
+        self._transport = transport
+        self._loop = loop
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+
+    def write(self, data: bytes):
+        self._pending.append(data)
+        self._pending_bytes += len(data)
+        if self._pending_bytes >= _CAPNP_BUF_BYTES:
+            self._flush()
+        elif len(self._pending) == 1:
+            self._loop.call_soon(self._flush)
+
+    def _flush(self):
+        if not self._pending:
+            return
+        data = b"".join(self._pending)
+        self._pending.clear()
+        self._pending_bytes = 0
+        if not self._transport.is_closing():
+            self._transport.write(data)
+
+    def write_eof(self):
+        self._flush()
+        self._transport.write_eof()
+
+    def close(self):
+        self._flush()
+        self._transport.close()
+
+    def __getattr__(self, name):
+        # pause_reading, resume_reading, is_closing, abort, get_extra_info...
+        return getattr(self._transport, name)
+
+
+async def _open_stream(host: str, port: int) -> Any:
+    """
+    Open a Cap'n Proto stream to host:port with coalesced writes.
+
+    Mirrors capnp.AsyncIoStream.create_connection() but installs
+    _CoalescingTransport on the protocol. That relies on pycapnp internals
+    (_PyAsyncIoStreamProtocol and AsyncIoStream._post_init, present in
+    2.0-2.2); builds without them get the plain public stream instead.
+    """
+    protocol_class = getattr(capnp.lib.capnp, "_PyAsyncIoStreamProtocol", None)
+    if protocol_class is None or not hasattr(capnp.AsyncIoStream, "_post_init"):
+        return await capnp.AsyncIoStream.create_connection(host, port)
+
+    loop = asyncio.get_running_loop()
+    stream = capnp.AsyncIoStream()
+    transport, protocol = await loop.create_connection(protocol_class, host, port)
+    protocol.transport = _CoalescingTransport(transport, loop)
+    stream._post_init(protocol)
+    return stream
+
+
+@functools.lru_cache(maxsize=4)
+def _load_schema(path: str) -> Any:
+    """Load and cache a Cap'n Proto schema; parsed once per path per process."""
+    return capnp.load(path)
+
+
+@functools.lru_cache(maxsize=1)
+def _turbojpeg() -> Any:
+    """Return a shared PyTurboJPEG encoder, or None if it is unavailable."""
+    try:
+        from turbojpeg import TurboJPEG
+
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        # Module not installed, or libturbojpeg not found
+        return None
+
+
+def _encode_jpeg(frame: Any, quality: int) -> BytesLike:
+    """JPEG-encode a BGR image array with PyTurboJPEG, falling back to OpenCV."""
+    encoder = _turbojpeg()
+    if encoder is not None:
+        from turbojpeg import TJSAMP_420
+
+        # 4:2:0 matches cv2.imencode and live_video_udp.py
+        return encoder.encode(frame, quality=quality, jpeg_subsample=TJSAMP_420)
+
+    import cv2
+
+    ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("JPEG encoding failed")
+    # uint8 ndarray; sent through its buffer without a tobytes() copy
+    return buf
+
+
+# pycapnp readers can be read by pre-resolved field descriptor through the
+# private _get_by_field (pycapnp 2.x); builds without it use the by-name _get
+_HAS_GET_BY_FIELD = hasattr(
+    getattr(capnp.lib.capnp, "_DynamicStructReader", None), "_get_by_field"
+)
+
+
+class _StructToDict:
+    """
+    Convert Cap'n Proto struct readers into plain dictionaries.
+
+    Field descriptors are resolved once per schema and read with
+    ``_get_by_field``, which skips the by-name field lookup pycapnp performs
+    on every attribute access and is several times faster for small structs
+    that are converted on every poll. If the installed pycapnp lacks
+    ``_get_by_field``, fields are read by name with ``_get`` instead.
+    ``keys`` renames the fields in the resulting dicts (defaults to the
+    field names).
+    """
+
+    def __init__(self, *names: str, keys: Optional[Tuple[str, ...]] = None):
+        self.names = names
+        self.keys = keys or names
+        # (schema, field descriptors) swapped as one tuple so concurrent
+        # callers on different loops never see a mismatched pair
+        self._resolved: Optional[Tuple[Any, List[Any]]] = None
+
+    def _fields(self, schema) -> List[Any]:
+        resolved = self._resolved
+        if resolved is None or resolved[0] != schema:
+            resolved = (schema, [schema.fields[name] for name in self.names])
+            self._resolved = resolved
+        return resolved[1]
+
+    def __call__(self, reader) -> Dict:
+        if not _HAS_GET_BY_FIELD:
+            return dict(zip(self.keys, map(reader._get, self.names)))
+        fields = self._fields(reader.schema)
+        return dict(zip(self.keys, map(reader._get_by_field, fields)))
+
+    def many(self, readers) -> List[Dict]:
+        """Convert a list of readers, resolving the fields only once."""
+        if not len(readers):
+            return []
+        keys = self.keys
+        if not _HAS_GET_BY_FIELD:
+            names = self.names
+            return [dict(zip(keys, map(r._get, names))) for r in readers]
+        fields = self._fields(readers[0].schema)
+        return [dict(zip(keys, map(r._get_by_field, fields))) for r in readers]
+
+
+# Reader -> dict converters for structs returned by NodeService
+_node_to_dict = _StructToDict("id", "status", "latencyMs", "threatScore")
+_quality_to_dict = _StructToDict("latencyMs", "jitterMs", "packetLoss")
+_metrics_to_dict = _StructToDict(
+    "avgRttMs", "packetLoss", "bandwidthMbps", "peerCount", "cpuUsage", "ioCapacity"
+)
+_stream_stats_to_dict = _StructToDict(
+    "framesSent", "framesReceived", "bytesSent", "bytesReceived", "avgLatencyMs"
+)
+_capacity_to_dict = _StructToDict(
+    "cpuCores", "ramMb", "currentLoad", "diskMb", "bandwidthMbps"
+)
+_job_status_to_dict = _StructToDict(
+    "jobId",
+    "status",
+    "progress",
+    "completedChunks",
+    "totalChunks",
+    "estimatedTimeRemaining",
+    "errorMsg",
+)
+# Data fields already come back as fresh bytes, so no bytes() copy is needed
+_chat_message_to_dict = _StructToDict(
+    "fromPeer",
+    "toPeer",
+    "message",
+    "timestamp",
+    "messageId",
+    "encryptionType",
+    keys=("from", "to", "message", "timestamp", "messageId", "encryptionType"),
+)
+_ml_status_to_dict = _StructToDict(
+    "taskId",
+    "currentEpoch",
+    "totalEpochs",
+    "activeWorkers",
+    "completedWorkers",
+    "currentLoss",
+    "currentAccuracy",
+    "estimatedTimeRemaining",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _chat_history_path() -> str:
+    """Path of the chat history file kept by the Go communication service."""
+    return str(Path.home() / ".pangea" / "communication" / "chat_history.json")
+
+
+@functools.lru_cache(maxsize=4)
+def _read_chat_history(path: str, version: Tuple[int, int, int]) -> Dict:
+    """
+    Parse a chat history file, reusing the result while the file is unchanged.
+
+    ``version`` is (st_ino, st_mtime_ns, st_size) from a fresh stat, so a
+    rewrite or replacement of the file misses the cache and is parsed again.
+    """
+    with open(path, "rb") as f:
+        return _json.loads(f.read())
+
+
+@functools.lru_cache(maxsize=4)
+def _merged_chat_history(path: str, version: Tuple[int, int, int]) -> List[Dict]:
+    """All peers' messages from _read_chat_history, sorted by timestamp."""
+    history = _read_chat_history(path, version)
+    # Each peer's list is already in order, so the sort only merges runs
+    return sorted(
+        itertools.chain.from_iterable(history.values()),
+        key=lambda m: m.get("timestamp", ""),
+    )
+
+
+def _ttl_cache(ttl_secs: float):
+    """
+    Cache a GoNodeClient method's result for ttl_secs seconds.
+
+    Results are stored in ``self._cache`` keyed by method name and arguments;
+    the clients of a GoNodeClientPool share one cache. Failed (None) or empty results are not cached so that errors
+    are retried on the next call. Cache hits return the same object, so
+    callers should treat cached results as read-only.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            key = (method.__name__, args)
+            now = time.monotonic()
+            with self._cache_lock:
+                entry = self._cache.get(key)
+            if entry is not None and now - entry[0] < ttl_secs:
+                return entry[1]
+
+            result = method(self, *args)
+            if result:
+                with self._cache_lock:
+                    self._cache[key] = (now, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class _LoopThread:
+    """
+    Background thread running an asyncio loop with the KJ event loop entered.
+
+    The KJ loop is entered once for the lifetime of the thread, so clients can
+    connect, disconnect and reconnect on it without re-initialising KJ or
+    spawning a new thread.
+
+    Connected clients are held in ``clients`` until they disconnect. Cap'n
+    Proto objects must be destroyed on the thread that owns the KJ loop, so
+    a client must not be garbage collected (and its connection torn down) on
+    another thread; close() disconnects any that remain at exit.
+
+    Coroutines handed over with submit() are queued and started together,
+    so threads calling at the same time share one loop wakeup.
+    """
+
+    def __init__(self, name: str = "capnp-loop"):
+        self.loop = asyncio.new_event_loop()
+        self.clients: set = set()
+        self._pending: collections.deque = collections.deque()
+        self._pending_lock = threading.Lock()
+        self._drain_scheduled = False
+        self._stop: Optional[asyncio.Event] = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout=2.0):
+            raise RuntimeError("Event loop failed to start")
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        if sys.version_info >= (3, 12):
+            # RPC coroutines start running as soon as they are submitted
+            # instead of waiting for the next loop iteration
+            self.loop.set_task_factory(asyncio.eager_task_factory)
+        self.loop.run_until_complete(self._main())
+
+    async def _main(self):
+        async with capnp.kj_loop():
+            self._stop = asyncio.Event()
+            self._ready.set()
+            await self._stop.wait()
+
+    def submit(self, coro) -> "concurrent.futures.Future[Any]":
+        """
+        Schedule a coroutine on the loop from another thread.
+
+        Like asyncio.run_coroutine_threadsafe, except that only the first
+        caller since the last drain wakes the loop; coroutines submitted
+        while that wakeup is pending start in the same loop iteration, so
+        their Cap'n Proto writes are also coalesced.
+        """
+        future: "concurrent.futures.Future[Any]" = concurrent.futures.Future()
+        with self._pending_lock:
+            self._pending.append((coro, future))
+            if self._drain_scheduled:
+                return future
+            self._drain_scheduled = True
+        try:
+            self.loop.call_soon_threadsafe(self._drain)
+        except RuntimeError as e:
+            # Loop already closed: fail everything queued behind this wakeup
+            for pending_coro, pending_future in self._take_pending():
+                pending_coro.close()
+                pending_future.set_exception(e)
+        return future
+
+    def _take_pending(self) -> List[Tuple[Any, "concurrent.futures.Future[Any]"]]:
+        """Empty the submit() queue and allow the next caller to wake the loop."""
+        with self._pending_lock:
+            batch = list(self._pending)
+            self._pending.clear()
+            self._drain_scheduled = False
+        return batch
+
+    def _drain(self):
+        """Start every queued coroutine as a task; runs on the loop."""
+        for coro, future in self._take_pending():
+            if not future.set_running_or_notify_cancel():
+                coro.close()
+                continue
+            task = self.loop.create_task(coro)
+            task.add_done_callback(functools.partial(_copy_task_result, future))
+
+    def close(self):
+        """Disconnect remaining clients and stop the loop thread."""
+        for client in list(self.clients):
+            client.disconnect()
+        if self._stop is not None and self._thread.is_alive():
+            self.loop.call_soon_threadsafe(self._stop.set)
+            self._thread.join(timeout=2.0)
+
+
+def _copy_task_result(future: "concurrent.futures.Future[Any]", task: asyncio.Task):
+    """Pass a finished task's outcome to the future returned by submit()."""
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+_SHARED_LOOPS: Dict[int, _LoopThread] = {}
+_SHARED_LOOP_LOCK = threading.Lock()
+
+
+def _shared_loop(index: int = 0) -> _LoopThread:
+    """
+    Return a process-wide loop thread used by sync GoNodeClient calls.
+
+    Clients share loop 0 unless given another loop_index; GoNodeClientPool
+    spreads its clients over several loops on free-threaded Python.
+    """
+    with _SHARED_LOOP_LOCK:
+        loop_thread = _SHARED_LOOPS.get(index)
+        if loop_thread is None:
+            name = f"capnp-loop-{index}" if index else "capnp-loop"
+            loop_thread = _SHARED_LOOPS[index] = _LoopThread(name)
+            atexit.register(loop_thread.close)
+        return loop_thread
+
 
 class GoNodeClient:
-    """Client for connecting to a Go node via Cap'n Proto RPC."""
+    """
+    Client for connecting to a Go node via Cap'n Proto RPC.
+
+    The blocking API (connect(), get_node(), ...) runs Cap'n Proto calls on a
+    loop thread shared by every client in the process with the same
+    loop_index (0 by default). Every blocking RPC method has a *_async twin
+    (get_node_async(), ...) that awaits the call directly on the
+    connection's loop; asyncio applications can await connect_async()
+    inside capnp.kj_loop() and use only those, without any thread hop.
+
+    The *_async methods raise on RPC errors (including a failure reported
+    by the Go node) rather than logging and returning a default value, and
+    bypass the short-lived result cache of the blocking getters. Blocking
+    methods raise RuntimeError when called on the connection's own loop,
+    where waiting for the result would deadlock.
+    """
+
+    # No per-instance __dict__: pools create several clients, and the RPC
+    # paths read _connected, _loop and service on every call
+    __slots__ = (
+        "host",
+        "port",
+        "loop_index",
+        "schema_path",
+        "client",
+        "service",
+        "schema",
+        "_connected",
+        "_loop",
+        "_loop_thread",
+        "_cache",
+        "_cache_lock",
+        "_outbox",
+        "_outbox_lock",
+        "_outbox_scheduled",
+        "_inflight_sends",
+    )
+
+    # Cached getters whose results change when peers connect or disconnect
+    _PEER_DEPENDENT_METHODS = (
+        "get_all_nodes",
+        "get_all_nodes_columnar",
+        "get_connected_peers",
+        "get_network_metrics",
+    )
+
+    # Cached getters whose results change when compute jobs start or stop
+    _LOAD_DEPENDENT_METHODS = ("get_compute_capacity",)
 
     def __init__(
         self,
         host: str = "localhost",
         port: int = 8080,
         schema_path: Optional[str] = None,
+        loop_index: int = 0,
     ):
         """
         Initialize Go node client.
@@ -37,9 +517,12 @@ class GoNodeClient:
             host: Go node host address
             port: Go node RPC port (default 8080)
             schema_path: Path to schema.capnp file (if None, uses absolute path from project root)
+            loop_index: Shared loop thread for the blocking API; clients with
+                different indices run their RPCs on separate threads
         """
         self.host = host
         self.port = port
+        self.loop_index = loop_index
 
         # Use absolute path if not provided
         if schema_path is None:
@@ -53,219 +536,529 @@ class GoNodeClient:
             else:
                 self.schema_path = schema_path
 
-        self.client: Optional[Any] = None
-        self.service: Optional[Any] = None
-        self.schema: Optional[Any] = None
+        self.client: Any = None
+        self.service: Any = None
+        self.schema: Any = None
         self._connected: bool = False
-        self._loop_thread: Optional[threading.Thread] = None
-        self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
-        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
-        self._connection_event: threading.Event = threading.Event()
-        self._connection_error: Optional[BaseException] = None
-        self._connection_future: Optional[Future] = None
-
-    def _run_event_loop(self):
-        """Run the Cap'n Proto event loop in a background thread."""
-        asyncio.set_event_loop(self._loop)
-        self._loop.run_forever()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[_LoopThread] = None
+        self._cache: Dict[Tuple[str, Tuple], Tuple[float, Any]] = {}
+        self._cache_lock: threading.Lock = threading.Lock()
+        self._outbox: collections.deque = collections.deque()
+        self._outbox_lock: threading.Lock = threading.Lock()
+        self._outbox_scheduled: bool = False
+        self._inflight_sends: threading.BoundedSemaphore = threading.BoundedSemaphore(
+            _MAX_INFLIGHT_SENDS
+        )
 
     def _get_loop(self) -> asyncio.AbstractEventLoop:
-        """Return the background event loop or raise if not initialized."""
+        """Return the event loop owning the connection or raise if not initialized."""
         if self._loop is None:
             raise RuntimeError("Event loop not initialized")
         return self._loop
 
-    def connect(self) -> bool:
-        """Connect to Go node. Returns True if successful."""
+    def _on_loop(self) -> bool:
+        """Check whether the caller is running on the connection's event loop."""
         try:
-            # Reset connection state
-            self._connection_event.clear()
-            self._connection_error = None
-
-            # Create a new event loop for the background thread
-            self._loop = asyncio.new_event_loop()
-
-            # Start the event loop in a background thread
-            self._loop_thread = threading.Thread(
-                target=self._run_event_loop, daemon=True
-            )
-            self._loop_thread.start()
-
-            # Wait for the loop to start (with proper synchronization)
-            max_retries = 10
-            for _ in range(max_retries):
-                if self._loop.is_running():
-                    break
-                time.sleep(0.01)
-
-            if not self._loop.is_running():
-                raise RuntimeError("Event loop failed to start")
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
 
-            # Connect using asyncio.run_coroutine_threadsafe
-            async def _async_connect():
-                try:
-                    async with capnp.kj_loop():
-                        # Load schema
-                        self.schema = capnp.load(self.schema_path)
-
-                        # Connect to Go node using AsyncIoStream
-                        sock = await capnp.AsyncIoStream.create_connection(
-                            self.host, self.port
-                        )
-                        self.client = capnp.TwoPartyClient(sock)
-                        self.service = self.client.bootstrap().cast_as(
-                            self.schema.NodeService
-                        )
-                        self._connected = True
-                        logger.info(f"Connected to Go node at {self.host}:{self.port}")
-
-                        # Signal connection success
-                        self._connection_event.set()
-
-                        # Keep the loop alive
-                        while self._connected:
-                            await asyncio.sleep(0.1)
-                except Exception as e:
-                    self._connection_error = e
-                    self._connection_event.set()  # Signal even on error
-                    raise
+    async def _bootstrap(self):
+        """Open the Cap'n Proto connection on the current event loop."""
+        self.schema = _load_schema(self.schema_path)
+
+        # Connect to Go node using AsyncIoStream
+        sock = await _open_stream(self.host, self.port)
+        self.client = capnp.TwoPartyClient(sock)
+        self.service = self.client.bootstrap().cast_as(self.schema.NodeService)
+        self._connected = True
+        logger.info(f"Connected to Go node at {self.host}:{self.port}")
+
+    async def _release(self):
+        """Close the connection; must run on the loop that owns it."""
+        client = self.client
+        self.service = None
+        self.client = None
+        if client is not None:
+            client.close()
 
-            # Schedule the connection in the background loop
-            self._connection_future = asyncio.run_coroutine_threadsafe(
-                _async_connect(), self._loop
+    def connect(self) -> bool:
+        """Connect to Go node. Returns True if successful."""
+        try:
+            self._loop_thread = _shared_loop(self.loop_index)
+            self._loop = self._loop_thread.loop
+            future = asyncio.run_coroutine_threadsafe(
+                self._bootstrap(), self._get_loop()
             )
+            try:
+                future.result(timeout=_CONNECT_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                # Cancel the pending bootstrap so a stalled connect does not
+                # leave a task behind on the shared loop
+                future.cancel()
+                raise
+            # Keep the client alive until disconnect() so its connection is
+            # never torn down by garbage collection on another thread
+            self._loop_thread.clients.add(self)
+            return self._connected
+        except Exception as e:
+            logger.error(f"Failed to connect to Go node: {e}")
+            self._connected = False
+            return False
 
-            # Wait for connection with timeout (proper synchronization instead of sleep)
-            if not self._connection_event.wait(timeout=5.0):
-                # Cancel the future on timeout to clean up the background task
-                if self._connection_future:
-                    self._connection_future.cancel()
-                raise TimeoutError("Connection timed out")
-
-            # Check if connection failed
-            if self._connection_error:
-                raise self._connection_error
+    async def connect_async(self) -> bool:
+        """
+        Connect to Go node on the running event loop. Returns True if successful.
 
+        Must be awaited inside ``capnp.kj_loop()`` (for example via
+        ``asyncio.run(capnp.run(main()))``). The *_async methods of this
+        client then run directly on that loop.
+        """
+        try:
+            self._loop_thread = None
+            self._loop = asyncio.get_running_loop()
+            await asyncio.wait_for(self._bootstrap(), timeout=_CONNECT_TIMEOUT)
             return self._connected
         except Exception as e:
             logger.error(f"Failed to connect to Go node: {e}")
             self._connected = False
-            # Cancel any pending future to prevent coroutine from continuing
-            if self._connection_future:
-                self._connection_future.cancel()
-            if self._loop and self._loop.is_running():
-                self._loop.call_soon_threadsafe(self._loop.stop)
             return False
 
     def disconnect(self):
         """Disconnect from Go node."""
         self._connected = False
-        if self._loop and self._loop.is_running():
-            self._loop.call_soon_threadsafe(self._loop.stop)
-        if self._loop_thread and self._loop_thread.is_alive():
-            self._loop_thread.join(timeout=2.0)
-        if self.client:
-            # Cap'n Proto client cleanup
-            pass
+        if self._loop_thread is not None:
+            self._loop_thread.clients.discard(self)
+        self._invalidate_cache()
+        with self._outbox_lock:
+            self._outbox.clear()
+        if self.client is not None and self._loop is not None:
+            if self._on_loop():
+                # Already on the owning loop: drop the objects inline
+                client = self.client
+                self.service = None
+                self.client = None
+                client.close()
+            else:
+                # Cap'n Proto objects must be released on the loop that owns them
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        self._release(), self._get_loop()
+                    ).result(timeout=2.0)
+                except Exception as e:
+                    logger.debug(f"Error closing Cap'n Proto client: {e}")
+        logger.info("Disconnected from Go node")
+
+    async def disconnect_async(self):
+        """Disconnect from Go node from within the connection's event loop."""
+        self._connected = False
+        self._invalidate_cache()
+        with self._outbox_lock:
+            self._outbox.clear()
+        await self._release()
         logger.info("Disconnected from Go node")
 
     def is_connected(self) -> bool:
         """Check if connected to Go node."""
         return self._connected
 
+    def _invalidate_cache(self, *method_names: str):
+        """Drop cached results for the given methods (all methods if none given)."""
+        with self._cache_lock:
+            if not method_names:
+                self._cache.clear()
+                return
+            for key in [k for k in self._cache if k[0] in method_names]:
+                del self._cache[key]
+
+    def _schedule(self, coro) -> "concurrent.futures.Future[Any]":
+        """Schedule a coroutine on the connection's event loop."""
+        if self._loop_thread is not None:
+            # Shared loop threads batch wakeups across concurrent callers
+            return self._loop_thread.submit(coro)
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+
+    def _submit(self, coro) -> "concurrent.futures.Future[Any]":
+        """
+        Schedule a coroutine on the connection's event loop from another thread.
+
+        Blocking on the result from the loop's own thread would deadlock, so
+        callers already on the loop are told to await the *_async method.
+        """
+        if self._on_loop():
+            coro.close()
+            raise RuntimeError(
+                "Blocking GoNodeClient method called on the client's event loop; "
+                "await the *_async method instead"
+            )
+        return self._schedule(coro)
+
+    def _call(self, coro, timeout: float, default: Any, error: str, *args: Any) -> Any:
+        """
+        Run an RPC coroutine via _submit, logging and returning default on failure.
+
+        The error message is a %-style template formatted with args only when
+        the call fails, so successful calls do no string formatting. Calling
+        from the connection's own event loop raises instead (see _submit).
+        """
+        future = self._submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except Exception as e:
+            logger.error(error + ": %s", *args, e)
+            return default
+
+    def _call_nowait(
+        self,
+        coro,
+        error: str,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> bool:
+        """
+        Schedule an RPC coroutine on the connection's event loop without waiting.
+
+        At most _MAX_INFLIGHT_SENDS calls are in flight per client; beyond that
+        the caller blocks for up to a second, after which the call is dropped
+        and False returned. Callers on the connection's own loop never block,
+        since the completions that free a slot run on that loop: the call is
+        dropped at once instead. Failures, including a False success flag
+        from the Go node, are logged and passed to on_error on the loop thread.
+        """
+        if self._on_loop():
+            acquired = self._inflight_sends.acquire(blocking=False)
+        else:
+            acquired = self._inflight_sends.acquire(timeout=1.0)
+        if not acquired:
+            coro.close()
+            logger.error(error + ": %s", "too many sends in flight")
+            return False
+        self._schedule(self._finish_nowait(coro, error, on_error))
+        return True
+
+    async def _finish_nowait(
+        self, coro, error: str, on_error: Optional[Callable[[Exception], None]]
+    ):
+        """Await a _call_nowait coroutine and report its failure."""
+        try:
+            if not await coro:
+                raise RuntimeError("rejected by Go node")
+        except Exception as e:
+            logger.error(error + ": %s", e)
+            if on_error is not None:
+                try:
+                    on_error(e)
+                except Exception:
+                    logger.exception("Error in on_error callback")
+        finally:
+            self._inflight_sends.release()
+
+    @staticmethod
+    async def _gather(
+        promises: List[Any],
+        keys: List[Any],
+        convert,
+        error: str,
+        failed: Any = None,
+    ) -> List[Any]:
+        """
+        Await pipelined RPC promises together, converting each result in order.
+
+        A failed call is logged with its key (``error`` is a %-style template
+        taking the key) and reported as ``failed`` without affecting the rest.
+        """
+        results = await asyncio.gather(*promises, return_exceptions=True)
+        converted = []
+        for key, result in zip(keys, results):
+            if isinstance(result, BaseException):
+                logger.error(error + ": %s", key, result)
+                converted.append(failed)
+            else:
+                converted.append(convert(result))
+        return converted
+
+    @staticmethod
+    async def _poll(
+        fetch: Callable[[], Any],
+        progress: Callable[[Dict], Any],
+        done: Callable[[Dict], bool],
+        on_update: Optional[Callable[[Dict], None]],
+        initial: float,
+        max_interval: float,
+    ) -> Dict:
+        """
+        Poll a status RPC until done(status), backing off while nothing changes.
+
+        The delay starts at ``initial`` and doubles (up to ``max_interval``)
+        after every poll whose progress(status) matches the previous one; any
+        change resets it and is reported to on_update on the loop thread.
+        """
+        interval = initial
+        last = None
+        while True:
+            status = await fetch()
+            key = progress(status)
+            if key != last:
+                last = key
+                interval = initial
+                if on_update is not None:
+                    on_update(status)
+            else:
+                interval = min(interval * 2, max_interval)
+            if done(status):
+                return status
+            await asyncio.sleep(interval)
+
     # Quick control functions - easy to execute
 
+    @_ttl_cache(1.0)
     def get_all_nodes(self) -> List[Dict]:
         """Get all nodes data. Returns list of node dictionaries."""
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_all_nodes():
-            result = await self.service.getAllNodes()
-            nodes = []
-            for node in result.nodes.nodes:
-                nodes.append(
-                    {
-                        "id": node.id,
-                        "status": node.status,
-                        "latencyMs": node.latencyMs,
-                        "threatScore": node.threatScore,
-                    }
-                )
-            return nodes
+        return self._call(
+            self.get_all_nodes_async(), 5.0, [], "Error getting all nodes"
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(
-                _async_get_all_nodes(), self._loop
-            )
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error getting all nodes: {e}")
-            return []
+    async def get_all_nodes_async(self) -> List[Dict]:
+        """Get all nodes data on the connection's event loop (uncached)."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getAllNodes()
+        return _node_to_dict.many(result.nodes.nodes)
+
+    @_ttl_cache(1.0)
+    def get_all_nodes_columnar(self) -> Optional[Dict[str, Any]]:
+        """
+        Get all nodes data as NumPy columns instead of one dict per node.
+
+        Returns a dict mapping each node field (id, status, latencyMs,
+        threatScore) to an array with one entry per node, so large node
+        lists can be filtered or sorted (e.g. by threatScore) without
+        building per-node Python objects. Returns None on error.
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return self._call(
+            self.get_all_nodes_columnar_async(), 5.0, None, "Error getting all nodes"
+        )
+
+    async def get_all_nodes_columnar_async(self) -> Dict[str, Any]:
+        """Get all nodes data as NumPy columns on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        import numpy as np
+
+        result = await self.service.getAllNodes()
+        nodes = result.nodes.nodes
+        count = len(nodes)
+        return {
+            "id": np.fromiter((n.id for n in nodes), np.uint32, count),
+            "status": np.fromiter((n.status for n in nodes), np.uint32, count),
+            "latencyMs": np.fromiter((n.latencyMs for n in nodes), np.float32, count),
+            "threatScore": np.fromiter(
+                (n.threatScore for n in nodes), np.float32, count
+            ),
+        }
 
     def get_node(self, node_id: int) -> Optional[Dict]:
         """Get specific node data by ID."""
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_node():
-            query = self.schema.NodeQuery.new_message()
-            query.nodeId = node_id
-            result = await self.service.getNode(query)
-            node = result.node
-            return {
-                "id": node.id,
-                "status": node.status,
-                "latencyMs": node.latencyMs,
-                "threatScore": node.threatScore,
-            }
+        return self._call(
+            self.get_node_async(node_id), 5.0, None, "Error getting node %s", node_id
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_node(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error getting node {node_id}: {e}")
-            return None
+    async def get_node_async(self, node_id: int) -> Dict:
+        """Get specific node data by ID on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self.service.getNode_request()
+        request.query.nodeId = node_id
+        result = await request.send()
+        return _node_to_dict(result.node)
+
+    def get_nodes(self, node_ids: List[int]) -> List[Optional[Dict]]:
+        """
+        Get data for several nodes in one batch.
+
+        NodeService has no batched lookup RPC, so instead of one request
+        carrying every ID (with a time-window coalescer in front of it), the
+        individual getNode calls are pipelined: all are issued at once over
+        the same Cap'n Proto connection and awaited together, so N lookups
+        cost one round-trip instead of N, but the Go node still handles N
+        calls.
+
+        Args:
+            node_ids: IDs of the nodes to fetch
+
+        Returns:
+            List of node dictionaries in the same order as node_ids,
+            with None for any node that could not be fetched
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return self._call(
+            self.get_nodes_async(node_ids),
+            5.0,
+            [None] * len(node_ids),
+            "Error getting nodes %s",
+            node_ids,
+        )
+
+    async def get_nodes_async(self, node_ids: List[int]) -> List[Optional[Dict]]:
+        """Get data for several nodes in one batch on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        promises = []
+        for node_id in node_ids:
+            request = self.service.getNode_request()
+            request.query.nodeId = node_id
+            promises.append(request.send())
+        return await self._gather(
+            promises,
+            node_ids,
+            lambda result: _node_to_dict(result.node),
+            "Error getting node %s",
+        )
 
     def get_connection_quality(self, peer_id: int) -> Optional[Dict]:
         """Get connection quality metrics for a peer."""
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_quality():
-            result = await self.service.getConnectionQuality(peer_id)
-            quality = result.quality
-            return {
-                "latencyMs": quality.latencyMs,
-                "jitterMs": quality.jitterMs,
-                "packetLoss": quality.packetLoss,
-            }
+        return self._call(
+            self.get_connection_quality_async(peer_id),
+            5.0,
+            None,
+            "Error getting connection quality for peer %s",
+            peer_id,
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_quality(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error getting connection quality for peer {peer_id}: {e}")
-            return None
+    async def get_connection_quality_async(self, peer_id: int) -> Dict:
+        """Get connection quality metrics for a peer on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getConnectionQuality(peer_id)
+        return _quality_to_dict(result.quality)
+
+    def get_connection_qualities(self, peer_ids: List[int]) -> List[Optional[Dict]]:
+        """
+        Get connection quality metrics for several peers in one batch.
+
+        Args:
+            peer_ids: IDs of the peers to query
+
+        Returns:
+            List of quality dictionaries in the same order as peer_ids,
+            with None for any peer that could not be queried
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return self._call(
+            self.get_connection_qualities_async(peer_ids),
+            5.0,
+            [None] * len(peer_ids),
+            "Error getting connection qualities for peers %s",
+            peer_ids,
+        )
+
+    async def get_connection_qualities_async(
+        self, peer_ids: List[int]
+    ) -> List[Optional[Dict]]:
+        """Get quality metrics for several peers on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return await self._gather(
+            [self.service.getConnectionQuality(peer_id) for peer_id in peer_ids],
+            peer_ids,
+            lambda result: _quality_to_dict(result.quality),
+            "Error getting connection quality for peer %s",
+        )
 
     def update_threat_score(self, node_id: int, threat_score: float) -> bool:
         """Update threat score for a node. Returns True if successful."""
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_update():
-            update = self.schema.NodeUpdate.new_message()
-            update.nodeId = node_id
-            update.threatScore = threat_score
-            result = await self.service.updateNode(update)
+        return self._call(
+            self.update_threat_score_async(node_id, threat_score),
+            5.0,
+            False,
+            "Error updating threat score for node %s",
+            node_id,
+        )
+
+    async def update_threat_score_async(
+        self, node_id: int, threat_score: float
+    ) -> bool:
+        """Update threat score for a node on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        try:
+            request = self.service.updateNode_request()
+            request.update.nodeId = node_id
+            request.update.threatScore = threat_score
+            result = await request.send()
             return result.success
+        finally:
+            self._invalidate_cache("get_all_nodes", "get_all_nodes_columnar")
+
+    def update_threat_scores(self, updates: List[Tuple[int, float]]) -> List[bool]:
+        """
+        Update threat scores for several nodes in one batch.
+
+        Args:
+            updates: (node_id, threat_score) pairs
+
+        Returns:
+            List of success flags in the same order as updates
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return self._call(
+            self.update_threat_scores_async(updates),
+            5.0,
+            [False] * len(updates),
+            "Error updating threat scores",
+        )
+
+    async def update_threat_scores_async(
+        self, updates: List[Tuple[int, float]]
+    ) -> List[bool]:
+        """Update threat scores for several nodes on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
 
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_update(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error updating threat score for node {node_id}: {e}")
-            return False
+            promises = []
+            for node_id, threat_score in updates:
+                request = self.service.updateNode_request()
+                request.update.nodeId = node_id
+                request.update.threatScore = threat_score
+                promises.append(request.send())
+            return await self._gather(
+                promises,
+                [node_id for node_id, _ in updates],
+                lambda result: result.success,
+                "Error updating threat score for node %s",
+                failed=False,
+            )
+        finally:
+            self._invalidate_cache("get_all_nodes", "get_all_nodes_columnar")
 
     def connect_to_peer(
         self, peer_id: int, host: str, port: int
@@ -284,146 +1077,356 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_connect_peer():
-            peer = self.schema.PeerAddress.new_message()
-            peer.peerId = peer_id
-            peer.host = host
-            peer.port = port
-            result = await self.service.connectToPeer(peer)
+        return self._call(
+            self.connect_to_peer_async(peer_id, host, port),
+            5.0,
+            (False, None),
+            "Error connecting to peer %s at %s:%s",
+            peer_id,
+            host,
+            port,
+        )
 
-            if result.success:
-                quality = result.quality
-                return True, {
-                    "latencyMs": quality.latencyMs,
-                    "jitterMs": quality.jitterMs,
-                    "packetLoss": quality.packetLoss,
-                }
-            return False, None
+    async def connect_to_peer_async(
+        self, peer_id: int, host: str, port: int
+    ) -> Tuple[bool, Optional[Dict]]:
+        """Connect to a new peer on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
 
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_connect_peer(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error connecting to peer {peer_id} at {host}:{port}: {e}")
+            peer = self.schema.PeerAddress.new_message(
+                peerId=peer_id, host=host, port=port
+            )
+            result = await self.service.connectToPeer(peer)
+
+            if result.success:
+                return True, _quality_to_dict(result.quality)
             return False, None
+        finally:
+            self._invalidate_cache(*self._PEER_DEPENDENT_METHODS)
 
     def disconnect_peer(self, peer_id: int) -> bool:
         """Disconnect from a peer. Returns True if successful."""
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_disconnect():
-            result = await self.service.disconnectPeer(peer_id)
-            return result.success
+        return self._call(
+            self.disconnect_peer_async(peer_id),
+            5.0,
+            False,
+            "Error disconnecting peer %s",
+            peer_id,
+        )
+
+    async def disconnect_peer_async(self, peer_id: int) -> bool:
+        """Disconnect from a peer on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
 
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_disconnect(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error disconnecting peer {peer_id}: {e}")
-            return False
+            result = await self.service.disconnectPeer(peer_id)
+            return result.success
+        finally:
+            self._invalidate_cache(*self._PEER_DEPENDENT_METHODS)
 
+    @_ttl_cache(1.0)
     def get_connected_peers(self) -> List[int]:
         """Get list of connected peer IDs."""
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_peers():
-            result = await self.service.getConnectedPeers()
-            return list(result.peers)
+        return self._call(
+            self.get_connected_peers_async(), 5.0, [], "Error getting connected peers"
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_peers(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error getting connected peers: {e}")
-            return []
+    async def get_connected_peers_async(self) -> List[int]:
+        """Get list of connected peer IDs on the connection's event loop (uncached)."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getConnectedPeers()
+        return list(result.peers)
 
-    def send_message(self, peer_id: int, data: bytes) -> bool:
-        """Send a message to a peer. Returns True if successful."""
+    def send_message(self, peer_id: int, data: BytesLike) -> bool:
+        """
+        Send a message to a peer. Returns True if successful.
+
+        data may be bytes, bytearray or memoryview (e.g. over a NumPy
+        array); buffers are passed to Cap'n Proto without an extra copy.
+        """
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_send():
-            msg = self.schema.Message.new_message()
-            msg.toPeerId = peer_id
-            msg.data = data
-            result = await self.service.sendMessage(msg)
-            return result.success
+        return self._call(
+            self.send_message_async(peer_id, data),
+            5.0,
+            False,
+            "Error sending message to peer %s",
+            peer_id,
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_send(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error sending message to peer {peer_id}: {e}")
-            return False
+    async def send_message_async(self, peer_id: int, data: BytesLike) -> bool:
+        """Send a message to a peer on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
 
+        request = self.service.sendMessage_request()
+        request.msg.toPeerId = peer_id
+        request.msg.data = _as_data(data)
+        result = await request.send()
+        return result.success
+
+    def send_messages(self, messages: List[Tuple[int, BytesLike]]) -> List[bool]:
+        """
+        Send several messages in one batch.
+
+        All sendMessage calls are written to the connection at once and
+        awaited together, so a burst of N small messages costs one round-trip
+        instead of N.
+
+        Args:
+            messages: (peer_id, data) pairs to send, in order
+
+        Returns:
+            List of success flags in the same order as messages
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return self._call(
+            self._send_batch(messages),
+            5.0,
+            [False] * len(messages),
+            "Error sending %d messages",
+            len(messages),
+        )
+
+    async def send_messages_async(
+        self, messages: List[Tuple[int, BytesLike]]
+    ) -> List[bool]:
+        """Send several messages in one batch on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return await self._send_batch(messages)
+
+    def send_message_nowait(self, peer_id: int, data: BytesLike) -> None:
+        """
+        Queue a message to a peer without waiting for the result.
+
+        Messages queued before the event loop picks up the queue are flushed
+        together through send_messages' batching, so fire-and-forget bursts
+        share socket writes instead of paying one round-trip each. Failures
+        are logged; messages still queued at disconnect() are dropped.
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        with self._outbox_lock:
+            self._outbox.append((peer_id, data))
+            if self._outbox_scheduled:
+                return
+            self._outbox_scheduled = True
+        self._schedule(self._flush_outbox())
+
+    async def _flush_outbox(self):
+        """Send everything queued by send_message_nowait as one batch."""
+        with self._outbox_lock:
+            batch = list(self._outbox)
+            self._outbox.clear()
+            self._outbox_scheduled = False
+        if batch and self._connected:
+            sent = await self._send_batch(batch)
+            failed = sent.count(False)
+            if failed:
+                logger.error(f"{failed} of {len(batch)} queued messages were not sent")
+
+    async def _send_batch(self, messages: List[Tuple[int, BytesLike]]) -> List[bool]:
+        """Issue pipelined sendMessage calls; failures are logged and reported as False."""
+        promises = []
+        for peer_id, data in messages:
+            request = self.service.sendMessage_request()
+            request.msg.toPeerId = peer_id
+            request.msg.data = _as_data(data)
+            promises.append(request.send())
+        return await self._gather(
+            promises,
+            [peer_id for peer_id, _ in messages],
+            lambda result: result.success,
+            "Error sending message to peer %s",
+            failed=False,
+        )
+
+    @_ttl_cache(2.0)
     def get_network_metrics(self) -> Optional[Dict]:
         """Get network metrics for shard optimization."""
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_metrics():
-            result = await self.service.getNetworkMetrics()
-            metrics = result.metrics
-            return {
-                "avgRttMs": metrics.avgRttMs,
-                "packetLoss": metrics.packetLoss,
-                "bandwidthMbps": metrics.bandwidthMbps,
-                "peerCount": metrics.peerCount,
-                "cpuUsage": metrics.cpuUsage,
-                "ioCapacity": metrics.ioCapacity,
-            }
+        return self._call(
+            self.get_network_metrics_async(), 5.0, None, "Error getting network metrics"
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_metrics(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error getting network metrics: {e}")
-            return None
+    async def get_network_metrics_async(self) -> Dict:
+        """Get network metrics on the connection's event loop (uncached)."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getNetworkMetrics()
+        return _metrics_to_dict(result.metrics)
+
+    def fetch_dashboard(self) -> Dict[str, Any]:
+        """
+        Fetch nodes, network metrics and compute capacity together.
+
+        The three queries are issued at once over the shared connection and
+        awaited together, so a dashboard refresh costs one round-trip rather
+        than three sequential ones.
+
+        Returns:
+            Dict with "nodes" (list of node dicts), "metrics" and "capacity"
+            (dicts, or None if that query failed)
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return self._call(
+            self.fetch_dashboard_async(),
+            5.0,
+            {"nodes": [], "metrics": None, "capacity": None},
+            "Error fetching dashboard",
+        )
+
+    async def fetch_dashboard_async(self) -> Dict[str, Any]:
+        """
+        Fetch nodes, network metrics and compute capacity on the event loop.
+
+        As with fetch_dashboard, a failed query is logged and left empty
+        rather than failing the whole refresh.
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        results: Tuple[Any, ...] = await asyncio.gather(
+            self.service.getAllNodes(),
+            self.service.getNetworkMetrics(),
+            self.service.getComputeCapacity(),
+            return_exceptions=True,
+        )
+        nodes, metrics, capacity = results
+        dashboard: Dict[str, Any] = {
+            "nodes": [],
+            "metrics": None,
+            "capacity": None,
+        }
+        if isinstance(nodes, BaseException):
+            logger.error(f"Error getting all nodes: {nodes}")
+        else:
+            dashboard["nodes"] = _node_to_dict.many(nodes.nodes.nodes)
+        if isinstance(metrics, BaseException):
+            logger.error(f"Error getting network metrics: {metrics}")
+        else:
+            dashboard["metrics"] = _metrics_to_dict(metrics.metrics)
+        if isinstance(capacity, BaseException):
+            logger.error(f"Error getting compute capacity: {capacity}")
+        else:
+            dashboard["capacity"] = _capacity_to_dict(capacity.capacity)
+        return dashboard
+
+    # CES Pipeline operations
+
+    def ces_process(
+        self, data: BytesLike, compression_level: int = 3
+    ) -> Optional[List[bytes]]:
+        """
+        Process data through CES pipeline (Compress, Encrypt, Shard).
+
+        Args:
+            data: Raw data to process (bytes, bytearray or memoryview)
+            compression_level: Compression level (0-22, default 3)
+
+        Returns:
+            List of shard data bytes, or None on error
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return self._call(
+            self.ces_process_async(data, compression_level),
+            10.0,
+            None,
+            "Error in CES process",
+        )
 
-    # CES Pipeline operations
+    async def ces_process_async(
+        self, data: BytesLike, compression_level: int = 3
+    ) -> List[bytes]:
+        """Process data through the CES pipeline on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
 
-    def ces_process(
-        self, data: bytes, compression_level: int = 3
-    ) -> Optional[List[bytes]]:
+        response = await self._send_ces_process(data, compression_level)
+        # pycapnp already hands Data fields back as fresh bytes objects,
+        # so return them directly instead of copying again
+        return [shard.data for shard in response.shards]
+
+    def ces_process_into(
+        self, data: BytesLike, out: bytearray, compression_level: int = 3
+    ) -> Optional[List[slice]]:
         """
-        Process data through CES pipeline (Compress, Encrypt, Shard).
+        Process data through the CES pipeline, writing all shards into ``out``.
+
+        ``out`` is cleared and the shards are appended to it back to back, so
+        a caller that reuses the same bytearray across calls keeps a single
+        growing buffer instead of allocating a list of shards plus a joined
+        copy. Shard i is ``out[slices[i]]``; the slices are only valid until
+        ``out`` is next modified (e.g. by the next call with the same buffer).
 
         Args:
-            data: Raw data to process
+            data: Raw data to process (bytes, bytearray or memoryview)
+            out: Buffer that receives the concatenated shards
             compression_level: Compression level (0-22, default 3)
 
         Returns:
-            List of shard data bytes, or None on error
+            List of slices locating each shard within ``out``, or None on error
         """
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_ces_process():
-            request = self.schema.CesProcessRequest.new_message()
-            request.data = data
-            request.compressionLevel = compression_level
-            result = await self.service.cesProcess(request)
-
-            if not result.response.success:
-                error_msg = result.response.errorMsg
-                logger.error(f"CES process failed: {error_msg}")
-                return None
-
-            # Extract shard data
-            shards = []
-            for shard in result.response.shards:
-                shards.append(bytes(shard.data))
+        return self._call(
+            self.ces_process_into_async(data, out, compression_level),
+            10.0,
+            None,
+            "Error in CES process",
+        )
 
-            return shards
+    async def ces_process_into_async(
+        self, data: BytesLike, out: bytearray, compression_level: int = 3
+    ) -> List[slice]:
+        """Process data through CES into ``out`` on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_ces_process(), self._loop)
-            return future.result(timeout=10.0)
-        except Exception as e:
-            logger.error(f"Error in CES process: {e}")
-            return None
+        response = await self._send_ces_process(data, compression_level)
+        del out[:]
+        slices = []
+        for shard in response.shards:
+            start = len(out)
+            out.extend(shard.data)
+            slices.append(slice(start, len(out)))
+        return slices
+
+    async def _send_ces_process(self, data: BytesLike, compression_level: int):
+        """Send a cesProcess request; returns the response, raising if it failed."""
+        call = self.service.cesProcess_request()
+        call.request.data = _as_data(data)
+        call.request.compressionLevel = compression_level
+        result = await call.send()
+
+        if not result.response.success:
+            raise RuntimeError(f"CES process failed: {result.response.errorMsg}")
+        return result.response
 
     def ces_reconstruct(
         self, shards: List[bytes], shard_present: List[bool], compression_level: int = 3
@@ -445,49 +1448,54 @@ class GoNodeClient:
         if len(shards) != len(shard_present):
             raise ValueError("shards and shard_present must have same length")
 
-        async def _async_ces_reconstruct():
-            request = self.schema.CesReconstructRequest.new_message()
-            request.compressionLevel = compression_level
+        return self._call(
+            self.ces_reconstruct_async(shards, shard_present, compression_level),
+            10.0,
+            None,
+            "Error in CES reconstruct",
+        )
+
+    async def ces_reconstruct_async(
+        self, shards: List[bytes], shard_present: List[bool], compression_level: int = 3
+    ) -> bytes:
+        """Reconstruct data from shards on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        if len(shards) != len(shard_present):
+            raise ValueError("shards and shard_present must have same length")
 
-            # Build shards list
-            shard_list = request.init("shards", len(shards))
-            for i, shard_data in enumerate(shards):
-                shard_msg = shard_list[i]
-                shard_msg.index = i
-                if shard_data:
-                    shard_msg.data = shard_data
-                else:
-                    shard_msg.data = b""
+        request = self.schema.CesReconstructRequest.new_message()
+        request.compressionLevel = compression_level
 
-            # Build present list
-            present_list = request.init("shardPresent", len(shard_present))
-            for i, present in enumerate(shard_present):
-                present_list[i] = present
+        # Build shards list. The Go side matches shards to shardPresent by
+        # position, so missing shards keep their slot; an unset Data field
+        # already reads back as empty, so only present data is written.
+        shard_at = request.init("shards", len(shards)).__getitem__
+        for i, shard_data in enumerate(shards):
+            shard_msg = shard_at(i)
+            shard_msg.index = i
+            if shard_data:
+                shard_msg.data = shard_data
 
-            result = await self.service.cesReconstruct(request)
+        # Assigning the whole list lets pycapnp fill it in one C-level pass
+        request.shardPresent = [bool(present) for present in shard_present]
 
-            if not result.response.success:
-                error_msg = result.response.errorMsg
-                logger.error(f"CES reconstruct failed: {error_msg}")
-                return None
+        result = await self.service.cesReconstruct(request)
 
-            return bytes(result.response.data)
+        if not result.response.success:
+            raise RuntimeError(f"CES reconstruct failed: {result.response.errorMsg}")
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(
-                _async_ces_reconstruct(), self._loop
-            )
-            return future.result(timeout=10.0)
-        except Exception as e:
-            logger.error(f"Error in CES reconstruct: {e}")
-            return None
+        return result.response.data
 
-    def upload(self, data: bytes, target_peers: List[int]) -> Optional[Dict]:
+    def upload(self, data: BytesLike, target_peers: List[int]) -> Optional[Dict]:
         """
         High-level upload: CES process + distribute to peers.
 
         Args:
-            data: Raw data to upload
+            data: Raw data to upload (bytes, bytearray or memoryview; a
+                memoryview over an mmap'd file is written into the request
+                without first being read into a bytes object)
             target_peers: List of peer IDs to distribute shards to
 
         Returns:
@@ -499,47 +1507,45 @@ class GoNodeClient:
         if not target_peers or len(target_peers) == 0:
             raise ValueError("target_peers cannot be empty or None")
 
-        async def _async_upload():
-            request = self.schema.UploadRequest.new_message()
-            request.data = data
-
-            # Build target peers list
-            peers_list = request.init("targetPeers", len(target_peers))
-            for i, peer_id in enumerate(target_peers):
-                peers_list[i] = peer_id
-
-            result = await self.service.upload(request)
-
-            if not result.response.success:
-                error_msg = result.response.errorMsg
-                logger.error(f"Upload failed: {error_msg}")
-                return None
-
-            # Extract manifest
-            manifest = result.response.manifest
-            shard_locations = []
-            for loc in manifest.shardLocations:
-                shard_locations.append(
-                    {"shardIndex": loc.shardIndex, "peerId": loc.peerId}
-                )
-
-            return {
-                "fileHash": manifest.fileHash,
-                "fileName": manifest.fileName,
-                "fileSize": manifest.fileSize,
-                "shardCount": manifest.shardCount,
-                "parityCount": manifest.parityCount,
-                "shardLocations": shard_locations,
-                "timestamp": manifest.timestamp,
-                "ttl": manifest.ttl,
-            }
+        return self._call(
+            self.upload_async(data, target_peers), 30.0, None, "Error in upload"
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_upload(), self._loop)
-            return future.result(timeout=30.0)
-        except Exception as e:
-            logger.error(f"Error in upload: {e}")
-            return None
+    async def upload_async(self, data: BytesLike, target_peers: List[int]) -> Dict:
+        """Upload data (CES process + distribute) on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        if not target_peers or len(target_peers) == 0:
+            raise ValueError("target_peers cannot be empty or None")
+
+        call = self.service.upload_request()
+        call.request.data = _as_data(data)
+
+        # Assigning the whole list fills it in one C-level pass
+        call.request.targetPeers = list(target_peers)
+
+        result = await call.send()
+
+        if not result.response.success:
+            raise RuntimeError(f"Upload failed: {result.response.errorMsg}")
+
+        # Extract manifest
+        manifest = result.response.manifest
+        shard_locations = []
+        for loc in manifest.shardLocations:
+            shard_locations.append({"shardIndex": loc.shardIndex, "peerId": loc.peerId})
+
+        return {
+            "fileHash": manifest.fileHash,
+            "fileName": manifest.fileName,
+            "fileSize": manifest.fileSize,
+            "shardCount": manifest.shardCount,
+            "parityCount": manifest.parityCount,
+            "shardLocations": shard_locations,
+            "timestamp": manifest.timestamp,
+            "ttl": manifest.ttl,
+        }
 
     def download(
         self, shard_locations: List[Dict], file_hash: str = ""
@@ -557,35 +1563,50 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_download():
-            request = self.schema.DownloadRequest.new_message()
-            request.fileHash = file_hash
-
-            # Build shard locations list
-            locs_list = request.init("shardLocations", len(shard_locations))
-            for i, loc in enumerate(shard_locations):
-                if "shardIndex" not in loc or "peerId" not in loc:
-                    raise ValueError(
-                        f"shard_locations[{i}] missing required keys 'shardIndex' or 'peerId'"
-                    )
-                loc_msg = locs_list[i]
-                loc_msg.shardIndex = loc["shardIndex"]
-                loc_msg.peerId = loc["peerId"]
-            result = await self.service.download(request)
+        return self._call(
+            self.download_async(shard_locations, file_hash),
+            30.0,
+            None,
+            "Error in download",
+        )
 
-            if not result.response.success:
-                error_msg = result.response.errorMsg
-                logger.error(f"Download failed: {error_msg}")
-                return None
+    async def download_async(
+        self, shard_locations: List[Dict], file_hash: str = ""
+    ) -> Tuple[bytes, int]:
+        """Download and reconstruct a file on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
 
-            return bytes(result.response.data), result.response.bytesDownloaded
+        request = self.schema.DownloadRequest.new_message()
+        request.fileHash = file_hash
 
+        # Pull both columns out up front; only a missing key sends us back
+        # over the list to find which entry to report
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_download(), self._loop)
-            return future.result(timeout=30.0)
-        except Exception as e:
-            logger.error(f"Error in download: {e}")
-            return None
+            indices = [loc["shardIndex"] for loc in shard_locations]
+            peers = [loc["peerId"] for loc in shard_locations]
+        except KeyError:
+            i = next(
+                i
+                for i, loc in enumerate(shard_locations)
+                if "shardIndex" not in loc or "peerId" not in loc
+            )
+            raise ValueError(
+                f"shard_locations[{i}] missing required keys 'shardIndex' or 'peerId'"
+            ) from None
+
+        # Fill the list in place instead of building an intermediate dict per shard
+        location_at = request.init("shardLocations", len(indices)).__getitem__
+        for i, (shard_index, peer_id) in enumerate(zip(indices, peers)):
+            location = location_at(i)
+            location.shardIndex = shard_index
+            location.peerId = peer_id
+        result = await self.service.download(request)
+
+        if not result.response.success:
+            raise RuntimeError(f"Download failed: {result.response.errorMsg}")
+
+        return result.response.data, result.response.bytesDownloaded
 
     # ========================================================================
     # Streaming Methods (Go handles all networking per Golden Rule)
@@ -613,49 +1634,56 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_start_streaming():
-            config = self.schema.StreamConfig.new_message()
-            config.port = port
-            config.peerHost = peer_host
-            config.peerPort = peer_port
-            config.streamType = stream_type
-            result = await self.service.startStreaming(config)
-            return result.success
+        return self._call(
+            self.start_streaming_async(port, peer_host, peer_port, stream_type),
+            10.0,
+            False,
+            "Error starting streaming",
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(
-                _async_start_streaming(), self._loop
-            )
-            return future.result(timeout=10.0)
-        except Exception as e:
-            logger.error(f"Error starting streaming: {e}")
-            return False
+    async def start_streaming_async(
+        self,
+        port: int,
+        peer_host: str = "",
+        peer_port: int = 9996,
+        stream_type: int = 0,
+    ) -> bool:
+        """Start streaming service on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        config = self.schema.StreamConfig.new_message(
+            port=port, peerHost=peer_host, peerPort=peer_port, streamType=stream_type
+        )
+        result = await self.service.startStreaming(config)
+        return result.success
 
     def stop_streaming(self) -> bool:
         """Stop streaming service."""
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_stop_streaming():
-            result = await self.service.stopStreaming()
-            return result.success
+        return self._call(
+            self.stop_streaming_async(), 5.0, False, "Error stopping streaming"
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(
-                _async_stop_streaming(), self._loop
-            )
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error stopping streaming: {e}")
-            return False
+    async def stop_streaming_async(self) -> bool:
+        """Stop streaming service on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.stopStreaming()
+        return result.success
 
     def send_video_frame(
         self,
         frame_id: int,
-        data: bytes,
+        data: BytesLike,
         width: int = 640,
         height: int = 480,
         quality: int = 60,
+        sync: bool = True,
+        on_error: Optional[Callable[[Exception], None]] = None,
     ) -> bool:
         """
         Send a video frame to the connected peer.
@@ -663,66 +1691,126 @@ class GoNodeClient:
 
         Args:
             frame_id: Unique frame identifier
-            data: JPEG encoded frame data
+            data: JPEG encoded frame data (bytes, bytearray or memoryview,
+                e.g. the ndarray returned by cv2.imencode, without a
+                bytes() copy)
             width: Frame width
             height: Frame height
             quality: JPEG quality (0-100)
+            sync: If False, return as soon as the frame is queued instead of
+                waiting a round-trip for the Go node's reply
+            on_error: Called with the exception if a sync=False send fails
 
         Returns:
-            True if successful
+            True if successful (with sync=False: if the frame was queued)
         """
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_send_frame():
-            frame = self.schema.VideoFrame.new_message()
-            frame.frameId = frame_id
-            frame.data = data
-            frame.width = width
-            frame.height = height
-            frame.quality = quality
-            result = await self.service.sendVideoFrame(frame)
-            return result.success
+        coro = self.send_video_frame_async(frame_id, data, width, height, quality)
+        if not sync:
+            return self._call_nowait(coro, "Error sending video frame", on_error)
+        # Short timeout for real-time
+        return self._call(coro, 1.0, False, "Error sending video frame")
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_send_frame(), self._loop)
-            return future.result(timeout=1.0)  # Short timeout for real-time
-        except Exception as e:
-            logger.error(f"Error sending video frame: {e}")
-            return False
+    async def send_video_frame_async(
+        self,
+        frame_id: int,
+        data: BytesLike,
+        width: int = 640,
+        height: int = 480,
+        quality: int = 60,
+    ) -> bool:
+        """Send a video frame to the connected peer on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self.service.sendVideoFrame_request()
+        frame = request.frame
+        frame.frameId = frame_id
+        frame.data = _as_data(data)
+        frame.width = width
+        frame.height = height
+        frame.quality = quality
+        result = await request.send()
+        return result.success
+
+    def send_video_frame_from_numpy(
+        self,
+        frame_id: int,
+        frame: Any,
+        quality: int = 60,
+        sync: bool = True,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> bool:
+        """
+        JPEG-encode an image array and send it as a video frame.
+
+        Uses PyTurboJPEG when installed and cv2.imencode otherwise; the
+        encoded buffer goes to send_video_frame as-is, without a bytes() copy.
+
+        Args:
+            frame_id: Unique frame identifier
+            frame: BGR image as a (height, width, 3) uint8 NumPy array
+            quality: JPEG quality (0-100)
+            sync: See send_video_frame
+            on_error: See send_video_frame
+
+        Returns:
+            True if successful (with sync=False: if the frame was queued)
+        """
+        height, width = frame.shape[:2]
+        data = _encode_jpeg(frame, quality)
+        return self.send_video_frame(
+            frame_id, data, width, height, quality, sync, on_error
+        )
 
     def send_audio_chunk(
-        self, data: bytes, sample_rate: int = 48000, channels: int = 1
+        self,
+        data: BytesLike,
+        sample_rate: int = 48000,
+        channels: int = 1,
+        sync: bool = True,
+        on_error: Optional[Callable[[Exception], None]] = None,
     ) -> bool:
         """
         Send an audio chunk to the connected peer.
         Go handles the actual UDP networking.
 
         Args:
-            data: Audio samples (16-bit PCM)
+            data: Audio samples (16-bit PCM; bytes, bytearray or memoryview,
+                e.g. over an int16 NumPy array, without a bytes() copy)
             sample_rate: Sample rate in Hz
             channels: Number of audio channels
+            sync: If False, return as soon as the chunk is queued instead of
+                waiting a round-trip for the Go node's reply
+            on_error: Called with the exception if a sync=False send fails
 
         Returns:
-            True if successful
+            True if successful (with sync=False: if the chunk was queued)
         """
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_send_audio():
-            chunk = self.schema.AudioChunk.new_message()
-            chunk.data = data
-            chunk.sampleRate = sample_rate
-            chunk.channels = channels
-            result = await self.service.sendAudioChunk(chunk)
-            return result.success
+        coro = self.send_audio_chunk_async(data, sample_rate, channels)
+        if not sync:
+            return self._call_nowait(coro, "Error sending audio chunk", on_error)
+        return self._call(coro, 1.0, False, "Error sending audio chunk")
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_send_audio(), self._loop)
-            return future.result(timeout=1.0)
-        except Exception as e:
-            logger.error(f"Error sending audio chunk: {e}")
-            return False
+    async def send_audio_chunk_async(
+        self, data: BytesLike, sample_rate: int = 48000, channels: int = 1
+    ) -> bool:
+        """Send an audio chunk to the connected peer on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self.service.sendAudioChunk_request()
+        chunk = request.chunk
+        chunk.data = _as_data(data)
+        chunk.sampleRate = sample_rate
+        chunk.channels = channels
+        result = await request.send()
+        return result.success
 
     def send_chat_message(self, peer_addr: str, message: str) -> bool:
         """
@@ -739,20 +1827,23 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_send_chat():
-            chat_msg = self.schema.ChatMessage.new_message()
-            chat_msg.peerAddr = peer_addr
-            chat_msg.message = message
-            chat_msg.timestamp = int(time.time() * 1000)
-            result = await self.service.sendChatMessage(chat_msg)
-            return result.success
+        return self._call(
+            self.send_chat_message_async(peer_addr, message),
+            5.0,
+            False,
+            "Error sending chat message",
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_send_chat(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error sending chat message: {e}")
-            return False
+    async def send_chat_message_async(self, peer_addr: str, message: str) -> bool:
+        """Send a chat message to a peer on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        chat_msg = self.schema.ChatMessage.new_message(
+            peerAddr=peer_addr, message=message, timestamp=int(time.time() * 1000)
+        )
+        result = await self.service.sendChatMessage(chat_msg)
+        return result.success
 
     def connect_stream_peer(self, host: str, port: int) -> Tuple[bool, str]:
         """
@@ -768,18 +1859,20 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_connect_stream():
-            result = await self.service.connectStreamPeer(host, port)
-            return result.success, result.peerAddr
+        return self._call(
+            self.connect_stream_peer_async(host, port),
+            10.0,
+            (False, ""),
+            "Error connecting to stream peer",
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(
-                _async_connect_stream(), self._loop
-            )
-            return future.result(timeout=10.0)
-        except Exception as e:
-            logger.error(f"Error connecting to stream peer: {e}")
-            return False, ""
+    async def connect_stream_peer_async(self, host: str, port: int) -> Tuple[bool, str]:
+        """Connect to a streaming peer on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.connectStreamPeer(host, port)
+        return result.success, result.peerAddr
 
     def get_stream_stats(self) -> Optional[Dict]:
         """
@@ -791,23 +1884,17 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_stats():
-            result = await self.service.getStreamStats()
-            stats = result.stats
-            return {
-                "framesSent": stats.framesSent,
-                "framesReceived": stats.framesReceived,
-                "bytesSent": stats.bytesSent,
-                "bytesReceived": stats.bytesReceived,
-                "avgLatencyMs": stats.avgLatencyMs,
-            }
+        return self._call(
+            self.get_stream_stats_async(), 5.0, None, "Error getting stream stats"
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_stats(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error getting stream stats: {e}")
-            return None
+    async def get_stream_stats_async(self) -> Dict:
+        """Get streaming statistics on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getStreamStats()
+        return _stream_stats_to_dict(result.stats)
 
     def get_received_frames(self, max_frames: int = 30) -> List[Dict]:
         """
@@ -822,27 +1909,31 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_frames():
-            result = await self.service.getReceivedFrames(max_frames)
-            frames = []
-            for frame in result.frames:
-                frames.append(
-                    {
-                        "frameId": frame.frameId,
-                        "data": bytes(frame.data),
-                        "width": frame.width,
-                        "height": frame.height,
-                        "quality": frame.quality,
-                    }
-                )
-            return frames
+        return self._call(
+            self.get_received_frames_async(max_frames),
+            2.0,
+            [],
+            "Error getting received frames",
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_frames(), self._loop)
-            return future.result(timeout=2.0)
-        except Exception as e:
-            logger.error(f"Error getting received frames: {e}")
-            return []
+    async def get_received_frames_async(self, max_frames: int = 30) -> List[Dict]:
+        """Get received video frames from buffer on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getReceivedFrames(max_frames)
+        frames = []
+        for frame in result.frames:
+            frames.append(
+                {
+                    "frameId": frame.frameId,
+                    "data": bytes(frame.data),
+                    "width": frame.width,
+                    "height": frame.height,
+                    "quality": frame.quality,
+                }
+            )
+        return frames
 
     def get_received_audio(self, max_chunks: int = 50) -> List[Dict]:
         """
@@ -857,25 +1948,29 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_audio():
-            result = await self.service.getReceivedAudio(max_chunks)
-            chunks = []
-            for chunk in result.chunks:
-                chunks.append(
-                    {
-                        "data": bytes(chunk.data),
-                        "sampleRate": chunk.sampleRate,
-                        "channels": chunk.channels,
-                    }
-                )
-            return chunks
+        return self._call(
+            self.get_received_audio_async(max_chunks),
+            2.0,
+            [],
+            "Error getting received audio",
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_audio(), self._loop)
-            return future.result(timeout=2.0)
-        except Exception as e:
-            logger.error(f"Error getting received audio: {e}")
-            return []
+    async def get_received_audio_async(self, max_chunks: int = 50) -> List[Dict]:
+        """Get received audio chunks from buffer on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getReceivedAudio(max_chunks)
+        chunks = []
+        for chunk in result.chunks:
+            chunks.append(
+                {
+                    "data": bytes(chunk.data),
+                    "sampleRate": chunk.sampleRate,
+                    "channels": chunk.channels,
+                }
+            )
+        return chunks
 
     def get_local_multiaddr(self) -> str:
         """
@@ -887,18 +1982,17 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_multiaddr():
-            result = await self.service.getLocalMultiaddr()
-            return result.multiaddr
+        return self._call(
+            self.get_local_multiaddr_async(), 5.0, "", "Error getting local multiaddr"
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(
-                _async_get_multiaddr(), self._loop
-            )
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error getting local multiaddr: {e}")
-            return ""
+    async def get_local_multiaddr_async(self) -> str:
+        """Get local node's multiaddr on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getLocalMultiaddr()
+        return result.multiaddr
 
     def list_libp2p_peers(self) -> List[str]:
         """
@@ -910,16 +2004,17 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_list_peers():
-            result = await self.service.listLibp2pPeers()
-            return list(result.peers)
+        return self._call(
+            self.list_libp2p_peers_async(), 5.0, [], "Error listing libp2p peers"
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_list_peers(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error listing libp2p peers: {e}")
-            return []
+    async def list_libp2p_peers_async(self) -> List[str]:
+        """Get list of connected libp2p peers on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.listLibp2pPeers()
+        return list(result.peers)
 
     def get_chat_history(self, peer_id: Optional[str] = None) -> List[Dict]:
         """
@@ -942,64 +2037,177 @@ class GoNodeClient:
             - to: Recipient peer ID
             - content: Message text
             - timestamp: ISO timestamp
-        """
-        import json
-        import os
-
-        # Path to chat history file stored by Go communication service
-        home_dir = os.path.expanduser("~")
-        history_file = os.path.join(
-            home_dir, ".pangea", "communication", "chat_history.json"
-        )
 
-        if not os.path.exists(history_file):
-            logger.info(f"Chat history file not found at {history_file}")
+            The file is only re-parsed when it changes, so repeated calls
+            return the same objects; treat them as read-only.
+        """
+        path = _chat_history_path()
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            logger.info(f"Chat history file not found at {path}")
             return []
 
         try:
-            with open(history_file, "r") as f:
-                history = json.load(f)
+            version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
             # history is a dict mapping peer_id -> list of messages
             if peer_id:
                 # Return messages for specific peer
-                messages = history.get(peer_id, [])
-                return messages
+                return _read_chat_history(path, version).get(peer_id, [])
             else:
-                # Flatten all messages from all peers
-                all_messages = []
-                for pid, messages in history.items():
-                    all_messages.extend(messages)
-                # Sort by timestamp
-                all_messages.sort(key=lambda m: m.get("timestamp", ""))
-                return all_messages
-
-        except json.JSONDecodeError as e:
+                # Flatten all messages from all peers, sorted by timestamp
+                return _merged_chat_history(path, version)
+
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError (a ValueError)
+        except ValueError as e:
             logger.error(f"Failed to parse chat history: {e}")
             return []
         except Exception as e:
             logger.error(f"Error reading chat history: {e}")
             return []
 
-    # ============================================================
-    # Distributed Compute Methods
-    # ============================================================
+    # ============================================================
+    # Distributed Compute Methods
+    # ============================================================
+
+    def submit_compute_job(
+        self,
+        job_id: str,
+        input_data: BytesLike,
+        split_strategy: str = "fixed",
+        min_chunk_size: int = 1024,
+        max_chunk_size: int = 65536,
+        timeout_secs: int = 300,
+        priority: int = 5,
+    ) -> Tuple[bool, str]:
+        """Submit a compute job to the Go orchestrator.
+
+        Args:
+            job_id: Unique job identifier
+            input_data: The input data to process (bytes, bytearray or
+                memoryview, sent without copying into a new bytes object)
+            split_strategy: How to split data ("fixed", "adaptive", "semantic")
+            min_chunk_size: Minimum chunk size in bytes
+            max_chunk_size: Maximum chunk size in bytes
+            timeout_secs: Job timeout in seconds
+            priority: Job priority (1-10, higher = more important)
+
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        future = self._submit(
+            self.submit_compute_job_async(
+                job_id,
+                input_data,
+                split_strategy,
+                min_chunk_size,
+                max_chunk_size,
+                timeout_secs,
+                priority,
+            )
+        )
+        try:
+            return future.result(timeout=10.0)
+        except Exception as e:
+            logger.error(f"Error submitting compute job: {e}")
+            return False, str(e)
+
+    async def submit_compute_job_async(
+        self,
+        job_id: str,
+        input_data: BytesLike,
+        split_strategy: str = "fixed",
+        min_chunk_size: int = 1024,
+        max_chunk_size: int = 65536,
+        timeout_secs: int = 300,
+        priority: int = 5,
+    ) -> Tuple[bool, str]:
+        """Submit a compute job to the orchestrator on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self._compute_job_request(
+            job_id,
+            input_data,
+            split_strategy,
+            min_chunk_size,
+            max_chunk_size,
+            timeout_secs,
+            priority,
+        )
+        try:
+            result = await request.send()
+        finally:
+            self._invalidate_cache(*self._LOAD_DEPENDENT_METHODS)
+        return result.success, result.errorMsg
+
+    def submit_compute_jobs(self, jobs: List[Dict[str, Any]]) -> List[Tuple[bool, str]]:
+        """Submit several compute jobs in one batch.
+
+        All submitComputeJob calls are issued together on the shared
+        connection, so N submissions cost one round-trip instead of N.
+
+        Args:
+            jobs: Keyword arguments for submit_compute_job, one dict per job
+                (job_id and input_data are required)
+
+        Returns:
+            List of (success, error_message) tuples in the same order as jobs
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return self._call(
+            self.submit_compute_jobs_async(jobs),
+            10.0,
+            [(False, "batch submission failed")] * len(jobs),
+            "Error submitting compute jobs",
+        )
 
-    def submit_compute_job(
+    async def submit_compute_jobs_async(
+        self, jobs: List[Dict[str, Any]]
+    ) -> List[Tuple[bool, str]]:
+        """Submit several compute jobs on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        try:
+            return await self._gather(
+                [self._compute_job_request(**job).send() for job in jobs],
+                [job["job_id"] for job in jobs],
+                lambda result: (result.success, result.errorMsg),
+                "Error submitting compute job %s",
+                (False, "submission failed"),
+            )
+        finally:
+            self._invalidate_cache(*self._LOAD_DEPENDENT_METHODS)
+
+    def submit_compute_job_with_status(
         self,
         job_id: str,
-        input_data: bytes,
+        input_data: BytesLike,
         split_strategy: str = "fixed",
         min_chunk_size: int = 1024,
         max_chunk_size: int = 65536,
         timeout_secs: int = 300,
         priority: int = 5,
-    ) -> Tuple[bool, str]:
-        """Submit a compute job to the Go orchestrator.
+    ) -> Tuple[bool, str, Optional[Dict]]:
+        """Submit a compute job and fetch its initial status in one call.
+
+        Both RPCs run in a single hop to the connection's event loop, but
+        getComputeJobStatus is only sent once submitComputeJob has replied:
+        the Go node may dispatch calls on the service concurrently, so a
+        status request pipelined behind the submission could be handled
+        before the job exists.
 
         Args:
             job_id: Unique job identifier
-            input_data: The input data to process
+            input_data: The input data to process (bytes, bytearray or
+                memoryview, sent without copying into a new bytes object)
             split_strategy: How to split data ("fixed", "adaptive", "semantic")
             min_chunk_size: Minimum chunk size in bytes
             max_chunk_size: Maximum chunk size in bytes
@@ -1007,34 +2215,98 @@ class GoNodeClient:
             priority: Job priority (1-10, higher = more important)
 
         Returns:
-            Tuple of (success, error_message)
+            Tuple of (success, error_message, status), where status is the
+            dict from get_compute_job_status, or None if the submission
+            failed or the status could not be fetched
         """
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_submit():
-            manifest = self.schema.ComputeJobManifest.new_message()
-            manifest.jobId = job_id
-            manifest.wasmModule = b""  # WASM module for complex jobs
-            manifest.inputData = input_data
-            manifest.splitStrategy = split_strategy
-            manifest.minChunkSize = min_chunk_size
-            manifest.maxChunkSize = max_chunk_size
-            manifest.verificationMode = "hash"
-            manifest.timeoutSecs = timeout_secs
-            manifest.retryCount = 3
-            manifest.priority = priority
-            manifest.redundancy = 1
-
-            result = await self.service.submitComputeJob(manifest)
-            return result.success, result.errorMsg
-
+        future = self._submit(
+            self.submit_compute_job_with_status_async(
+                job_id,
+                input_data,
+                split_strategy,
+                min_chunk_size,
+                max_chunk_size,
+                timeout_secs,
+                priority,
+            )
+        )
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_submit(), self._loop)
             return future.result(timeout=10.0)
         except Exception as e:
             logger.error(f"Error submitting compute job: {e}")
-            return False, str(e)
+            return False, str(e), None
+
+    async def submit_compute_job_with_status_async(
+        self,
+        job_id: str,
+        input_data: BytesLike,
+        split_strategy: str = "fixed",
+        min_chunk_size: int = 1024,
+        max_chunk_size: int = 65536,
+        timeout_secs: int = 300,
+        priority: int = 5,
+    ) -> Tuple[bool, str, Optional[Dict]]:
+        """Submit a compute job and fetch its status on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self._compute_job_request(
+            job_id,
+            input_data,
+            split_strategy,
+            min_chunk_size,
+            max_chunk_size,
+            timeout_secs,
+            priority,
+        )
+        try:
+            result = await request.send()
+        finally:
+            self._invalidate_cache(*self._LOAD_DEPENDENT_METHODS)
+        if not result.success:
+            return False, result.errorMsg, None
+
+        try:
+            result_status = await self.service.getComputeJobStatus(job_id)
+            status = _job_status_to_dict(result_status.status)
+        except Exception as e:
+            # The job was submitted, so report success without a status
+            logger.error(f"Error getting status for job {job_id}: {e}")
+            status = None
+        return True, result.errorMsg, status
+
+    def _compute_job_request(
+        self,
+        job_id: str,
+        input_data: BytesLike,
+        split_strategy: str = "fixed",
+        min_chunk_size: int = 1024,
+        max_chunk_size: int = 65536,
+        timeout_secs: int = 300,
+        priority: int = 5,
+    ) -> Any:
+        """Build a submitComputeJob request with its manifest filled in place."""
+        # The manifest is written straight into the request message by
+        # pycapnp's from_dict in one C-level pass, so the input is not copied
+        # through a standalone ComputeJobManifest message first
+        return self.service.submitComputeJob_request(
+            manifest={
+                "jobId": job_id,
+                "wasmModule": b"",  # WASM module for complex jobs
+                "inputData": _as_data(input_data),
+                "splitStrategy": split_strategy,
+                "minChunkSize": min_chunk_size,
+                "maxChunkSize": max_chunk_size,
+                "verificationMode": "hash",
+                "timeoutSecs": timeout_secs,
+                "retryCount": 3,
+                "priority": priority,
+                "redundancy": 1,
+            }
+        )
 
     def get_compute_job_status(self, job_id: str) -> Optional[Dict]:
         """Get status of a compute job.
@@ -1048,26 +2320,124 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_status():
-            result = await self.service.getComputeJobStatus(job_id)
-            status = result.status
-            return {
-                "jobId": status.jobId,
-                "status": status.status,
-                "progress": status.progress,
-                "completedChunks": status.completedChunks,
-                "totalChunks": status.totalChunks,
-                "estimatedTimeRemaining": status.estimatedTimeRemaining,
-                "errorMsg": status.errorMsg,
-            }
+        return self._call(
+            self.get_compute_job_status_async(job_id),
+            5.0,
+            None,
+            "Error getting compute job status",
+        )
+
+    async def get_compute_job_status_async(self, job_id: str) -> Dict:
+        """Get status of a compute job on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getComputeJobStatus(job_id)
+        return _job_status_to_dict(result.status)
+
+    def get_compute_job_statuses(self, job_ids: List[str]) -> List[Optional[Dict]]:
+        """Get the status of several compute jobs in one batch.
+
+        Like get_nodes(), this pipelines individual getComputeJobStatus calls
+        rather than using a batched RPC, which the schema does not have: all
+        are issued together on the shared connection, so polling N jobs costs
+        one round-trip instead of N.
+
+        Args:
+            job_ids: The job identifiers
+
+        Returns:
+            List of status dicts in the same order as job_ids, with None
+            for any job whose status could not be fetched
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return self._call(
+            self.get_compute_job_statuses_async(job_ids),
+            5.0,
+            [None] * len(job_ids),
+            "Error getting compute job statuses",
+        )
 
+    async def get_compute_job_statuses_async(
+        self, job_ids: List[str]
+    ) -> List[Optional[Dict]]:
+        """Get the status of several compute jobs on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return await self._gather(
+            [self.service.getComputeJobStatus(job_id) for job_id in job_ids],
+            job_ids,
+            lambda result: _job_status_to_dict(result.status),
+            "Error getting status for job %s",
+        )
+
+    def poll_compute_job(
+        self,
+        job_id: str,
+        on_update: Optional[Callable[[Dict], None]] = None,
+        initial: float = 0.1,
+        max_interval: float = 5.0,
+        timeout: Optional[float] = None,
+    ) -> Optional[Dict]:
+        """Wait for a compute job to finish, polling its status with backoff.
+
+        Polls start ``initial`` seconds apart and double, up to
+        ``max_interval``, while the job's state and completed chunks stay
+        the same, so waiting on a long job does not hammer the Go node.
+
+        Args:
+            job_id: The job identifier
+            on_update: Called on the client's loop thread with each status
+                that differs from the previous one
+            initial: Delay in seconds after a status change
+            max_interval: Longest delay in seconds between polls
+            timeout: Give up after this many seconds (None waits forever)
+
+        Returns:
+            The final status dict (completed, failed, timeout or cancelled),
+            or None on error or timeout
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        future = self._submit(
+            self.poll_compute_job_async(
+                job_id, on_update, initial, max_interval, timeout
+            )
+        )
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_status(), self._loop)
-            return future.result(timeout=5.0)
+            return future.result()
         except Exception as e:
-            logger.error(f"Error getting compute job status: {e}")
+            logger.error(f"Error polling compute job {job_id}: {e}")
             return None
 
+    async def poll_compute_job_async(
+        self,
+        job_id: str,
+        on_update: Optional[Callable[[Dict], None]] = None,
+        initial: float = 0.1,
+        max_interval: float = 5.0,
+        timeout: Optional[float] = None,
+    ) -> Dict:
+        """Wait for a compute job to finish on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return await asyncio.wait_for(
+            self._poll(
+                functools.partial(self.get_compute_job_status_async, job_id),
+                lambda status: (status["status"], status["completedChunks"]),
+                lambda status: status["status"] in _COMPUTE_JOB_FINAL_STATES,
+                on_update,
+                initial,
+                max_interval,
+            ),
+            timeout,
+        )
+
     def get_compute_job_result(
         self, job_id: str, timeout_ms: int = 60000
     ) -> Tuple[Optional[bytes], str, str]:
@@ -1084,22 +2454,27 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_result():
-            result = await self.service.getComputeJobResult(job_id, timeout_ms)
-            if result.success:
-                worker_node = (
-                    result.workerNode if hasattr(result, "workerNode") else "unknown"
-                )
-                return bytes(result.result), "", worker_node
-            return None, result.errorMsg, ""
-
+        future = self._submit(self.get_compute_job_result_async(job_id, timeout_ms))
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_result(), self._loop)
             return future.result(timeout=timeout_ms / 1000 + 5)
         except Exception as e:
             logger.error(f"Error getting compute job result: {e}")
             return None, str(e), ""
 
+    async def get_compute_job_result_async(
+        self, job_id: str, timeout_ms: int = 60000
+    ) -> Tuple[Optional[bytes], str, str]:
+        """Get the result of a completed compute job on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getComputeJobResult(job_id, timeout_ms)
+        if result.success:
+            # python/schema.capnp predates the workerNode field
+            worker_node = getattr(result, "workerNode", "unknown")
+            return result.result, "", worker_node
+        return None, result.errorMsg, ""
+
     def cancel_compute_job(self, job_id: str) -> bool:
         """Cancel a running compute job.
 
@@ -1112,17 +2487,25 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_cancel():
-            result = await self.service.cancelComputeJob(job_id)
-            return result.success
+        return self._call(
+            self.cancel_compute_job_async(job_id),
+            5.0,
+            False,
+            "Error cancelling compute job",
+        )
+
+    async def cancel_compute_job_async(self, job_id: str) -> bool:
+        """Cancel a running compute job on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
 
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_cancel(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error cancelling compute job: {e}")
-            return False
+            result = await self.service.cancelComputeJob(job_id)
+        finally:
+            self._invalidate_cache(*self._LOAD_DEPENDENT_METHODS)
+        return result.success
 
+    @_ttl_cache(5.0)
     def get_compute_capacity(self) -> Optional[Dict]:
         """Get compute capacity of the connected node.
 
@@ -1132,23 +2515,20 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_capacity():
-            result = await self.service.getCapacity()
-            cap = result.capacity
-            return {
-                "cpuCores": cap.cpuCores,
-                "ramMb": cap.ramMb,
-                "currentLoad": cap.currentLoad,
-                "diskMb": cap.diskMb,
-                "bandwidthMbps": cap.bandwidthMbps,
-            }
+        return self._call(
+            self.get_compute_capacity_async(),
+            5.0,
+            None,
+            "Error getting compute capacity",
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_capacity(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error getting compute capacity: {e}")
-            return None
+    async def get_compute_capacity_async(self) -> Dict:
+        """Get compute capacity on the connection's event loop (uncached)."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getComputeCapacity()
+        return _capacity_to_dict(result.capacity)
 
     # ========================================================================
     # Mandate 3: Security, Ephemeral Chat, and ML RPC Methods
@@ -1179,28 +2559,45 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_set_proxy():
-            request = self.service.setProxyConfig_request()
-            config = request.config
-            config.enabled = enabled
-            config.proxyType = proxy_type
-            config.proxyHost = proxy_host
-            config.proxyPort = proxy_port
-            config.username = username
-            config.passwordPresent = password != ""
-
-            result = await request.send()
-            return result.success, (
-                result.errorMsg if hasattr(result, "errorMsg") else ""
+        future = self._submit(
+            self.set_proxy_config_async(
+                enabled, proxy_host, proxy_port, proxy_type, username, password
             )
-
+        )
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_set_proxy(), self._loop)
             return future.result(timeout=5.0)
         except Exception as e:
             logger.error(f"Error setting proxy config: {e}")
             return False, str(e)
 
+    async def set_proxy_config_async(
+        self,
+        enabled: bool,
+        proxy_host: str,
+        proxy_port: int,
+        proxy_type: str = "socks5",
+        username: str = "",
+        password: str = "",
+    ) -> Tuple[bool, str]:
+        """Configure SOCKS5/Tor proxy on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self.service.setProxyConfig_request()
+        request.config.from_dict(
+            {
+                "enabled": enabled,
+                "proxyType": proxy_type,
+                "proxyHost": proxy_host,
+                "proxyPort": proxy_port,
+                "username": username,
+                "passwordPresent": password != "",
+            }
+        )
+
+        result = await request.send()
+        return result.success, result.errorMsg
+
     def get_proxy_config(self) -> Optional[Dict]:
         """Get current proxy configuration.
 
@@ -1210,24 +2607,25 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_proxy():
-            result = await self.service.getProxyConfig()
-            config = result.config
-            return {
-                "enabled": config.enabled,
-                "proxyType": config.proxyType,
-                "proxyHost": config.proxyHost,
-                "proxyPort": config.proxyPort,
-                "username": config.username,
-                "passwordPresent": config.passwordPresent,
-            }
+        return self._call(
+            self.get_proxy_config_async(), 5.0, None, "Error getting proxy config"
+        )
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_proxy(), self._loop)
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error getting proxy config: {e}")
-            return None
+    async def get_proxy_config_async(self) -> Dict:
+        """Get current proxy configuration on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        result = await self.service.getProxyConfig()
+        config = result.config
+        return {
+            "enabled": config.enabled,
+            "proxyType": config.proxyType,
+            "proxyHost": config.proxyHost,
+            "proxyPort": config.proxyPort,
+            "username": config.username,
+            "passwordPresent": config.passwordPresent,
+        }
 
     def set_encryption_config(
         self,
@@ -1250,28 +2648,41 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_set_encryption():
-            request = self.service.setEncryptionConfig_request()
-            config = request.config
-            config.encryptionType = encryption_type
-            config.keyExchangeAlgorithm = key_exchange
-            config.symmetricAlgorithm = symmetric_algo
-            config.enableSignatures = enable_signatures
-
-            result = await request.send()
-            return result.success, (
-                result.errorMsg if hasattr(result, "errorMsg") else ""
+        future = self._submit(
+            self.set_encryption_config_async(
+                encryption_type, key_exchange, symmetric_algo, enable_signatures
             )
-
+        )
         try:
-            future = asyncio.run_coroutine_threadsafe(
-                _async_set_encryption(), self._loop
-            )
             return future.result(timeout=5.0)
         except Exception as e:
             logger.error(f"Error setting encryption config: {e}")
             return False, str(e)
 
+    async def set_encryption_config_async(
+        self,
+        encryption_type: str,
+        key_exchange: str = "rsa",
+        symmetric_algo: str = "aes256",
+        enable_signatures: bool = True,
+    ) -> Tuple[bool, str]:
+        """Configure encryption for communications on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self.service.setEncryptionConfig_request()
+        request.config.from_dict(
+            {
+                "encryptionType": encryption_type,
+                "keyExchangeAlgorithm": key_exchange,
+                "symmetricAlgorithm": symmetric_algo,
+                "enableSignatures": enable_signatures,
+            }
+        )
+
+        result = await request.send()
+        return result.success, result.errorMsg
+
     def start_chat_session(
         self, peer_addr: str, encryption_type: str = "asymmetric"
     ) -> Tuple[bool, Optional[str], str]:
@@ -1287,28 +2698,36 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_start_chat():
-            request = self.service.startChatSession_request()
-            request.peerAddr = peer_addr
-
-            enc_config = request.encryptionConfig
-            enc_config.encryptionType = encryption_type
-            enc_config.keyExchangeAlgorithm = "rsa"
-            enc_config.symmetricAlgorithm = "aes256"
-            enc_config.enableSignatures = True
-
-            result = await request.send()
-            session_id = result.session.sessionId if result.success else None
-            error_msg = result.errorMsg if hasattr(result, "errorMsg") else ""
-            return result.success, session_id, error_msg
-
+        future = self._submit(self.start_chat_session_async(peer_addr, encryption_type))
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_start_chat(), self._loop)
             return future.result(timeout=5.0)
         except Exception as e:
             logger.error(f"Error starting chat session: {e}")
             return False, None, str(e)
 
+    async def start_chat_session_async(
+        self, peer_addr: str, encryption_type: str = "asymmetric"
+    ) -> Tuple[bool, Optional[str], str]:
+        """Start an ephemeral chat session on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self.service.startChatSession_request()
+        request.peerAddr = peer_addr
+
+        request.encryptionConfig.from_dict(
+            {
+                "encryptionType": encryption_type,
+                "keyExchangeAlgorithm": "rsa",
+                "symmetricAlgorithm": "aes256",
+                "enableSignatures": True,
+            }
+        )
+
+        result = await request.send()
+        session_id = result.session.sessionId if result.success else None
+        return result.success, session_id, result.errorMsg
+
     def send_ephemeral_message(
         self, session_id: str, from_peer: str, to_peer: str, message: bytes
     ) -> Tuple[bool, str]:
@@ -1326,27 +2745,38 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_send_message():
-            request = self.service.sendEphemeralMessage_request()
-            msg = request.message
-            msg.fromPeer = from_peer
-            msg.toPeer = to_peer
-            msg.message = message
-            msg.timestamp = int(time.time())
-            msg.messageId = f"msg-{int(time.time())}"
-            msg.encryptionType = "asymmetric"
-
-            result = await request.send()
-            error_msg = result.errorMsg if hasattr(result, "errorMsg") else ""
-            return result.success, error_msg
-
+        future = self._submit(
+            self.send_ephemeral_message_async(session_id, from_peer, to_peer, message)
+        )
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_send_message(), self._loop)
             return future.result(timeout=5.0)
         except Exception as e:
             logger.error(f"Error sending ephemeral message: {e}")
             return False, str(e)
 
+    async def send_ephemeral_message_async(
+        self, session_id: str, from_peer: str, to_peer: str, message: bytes
+    ) -> Tuple[bool, str]:
+        """Send an encrypted ephemeral message on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self.service.sendEphemeralMessage_request()
+        timestamp = int(time.time())
+        request.message.from_dict(
+            {
+                "fromPeer": from_peer,
+                "toPeer": to_peer,
+                "message": message,
+                "timestamp": timestamp,
+                "messageId": f"msg-{timestamp}-{next(_message_seq)}",
+                "encryptionType": "asymmetric",
+            }
+        )
+
+        result = await request.send()
+        return result.success, result.errorMsg
+
     def receive_chat_messages(self, session_id: str) -> List[Dict]:
         """Receive messages from a chat session.
 
@@ -1359,33 +2789,23 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_receive_messages():
-            request = self.service.receiveChatMessages_request()
-            request.sessionId = session_id
+        return self._call(
+            self.receive_chat_messages_async(session_id),
+            5.0,
+            [],
+            "Error receiving chat messages",
+        )
 
-            result = await request.send()
-            messages = []
-            for msg in result.messages:
-                messages.append(
-                    {
-                        "from": msg.fromPeer,
-                        "to": msg.toPeer,
-                        "message": bytes(msg.message),
-                        "timestamp": msg.timestamp,
-                        "messageId": msg.messageId,
-                        "encryptionType": msg.encryptionType,
-                    }
-                )
-            return messages
+    async def receive_chat_messages_async(self, session_id: str) -> List[Dict]:
+        """Receive messages from a chat session on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
 
-        try:
-            future = asyncio.run_coroutine_threadsafe(
-                _async_receive_messages(), self._loop
-            )
-            return future.result(timeout=5.0)
-        except Exception as e:
-            logger.error(f"Error receiving chat messages: {e}")
-            return []
+        request = self.service.receiveChatMessages_request()
+        request.sessionId = session_id
+
+        result = await request.send()
+        return _chat_message_to_dict.many(result.messages)
 
     def start_ml_training(
         self,
@@ -1414,34 +2834,53 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_start_training():
-            request = self.service.startMLTraining_request()
-            task = request.task
-            task.taskId = task_id
-            task.datasetId = dataset_id
-            task.modelArchitecture = model_arch
-            task.aggregatorNode = aggregator_node
-            task.epochs = epochs
-            task.batchSize = batch_size
-
-            # Set worker nodes
-            workers = task.init("workerNodes", len(worker_nodes))
-            for i, worker in enumerate(worker_nodes):
-                workers[i] = worker
-
-            result = await request.send()
-            error_msg = result.errorMsg if hasattr(result, "errorMsg") else ""
-            return result.success, error_msg
-
-        try:
-            future = asyncio.run_coroutine_threadsafe(
-                _async_start_training(), self._loop
+        future = self._submit(
+            self.start_ml_training_async(
+                task_id,
+                dataset_id,
+                model_arch,
+                worker_nodes,
+                aggregator_node,
+                epochs,
+                batch_size,
             )
+        )
+        try:
             return future.result(timeout=5.0)
         except Exception as e:
             logger.error(f"Error starting ML training: {e}")
             return False, str(e)
 
+    async def start_ml_training_async(
+        self,
+        task_id: str,
+        dataset_id: str,
+        model_arch: str,
+        worker_nodes: List[str],
+        aggregator_node: str,
+        epochs: int = 10,
+        batch_size: int = 32,
+    ) -> Tuple[bool, str]:
+        """Start distributed ML training task on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self.service.startMLTraining_request()
+        request.task.from_dict(
+            {
+                "taskId": task_id,
+                "datasetId": dataset_id,
+                "modelArchitecture": model_arch,
+                "aggregatorNode": aggregator_node,
+                "epochs": epochs,
+                "batchSize": batch_size,
+                "workerNodes": list(worker_nodes),
+            }
+        )
+
+        result = await request.send()
+        return result.success, result.errorMsg
+
     def get_ml_training_status(self, task_id: str) -> Optional[Dict]:
         """Get ML training task status.
 
@@ -1454,26 +2893,83 @@ class GoNodeClient:
         if not self._connected:
             raise RuntimeError("Not connected to Go node")
 
-        async def _async_get_status():
-            request = self.service.getMLTrainingStatus_request()
-            request.taskId = task_id
+        return self._call(
+            self.get_ml_training_status_async(task_id),
+            5.0,
+            None,
+            "Error getting ML training status",
+        )
 
-            result = await request.send()
-            status = result.status
-            return {
-                "taskId": status.taskId,
-                "currentEpoch": status.currentEpoch,
-                "totalEpochs": status.totalEpochs,
-                "activeWorkers": status.activeWorkers,
-                "completedWorkers": status.completedWorkers,
-                "currentLoss": status.currentLoss,
-                "currentAccuracy": status.currentAccuracy,
-                "estimatedTimeRemaining": status.estimatedTimeRemaining,
-            }
+    async def get_ml_training_status_async(self, task_id: str) -> Dict:
+        """Get ML training task status on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        request = self.service.getMLTrainingStatus_request()
+        request.taskId = task_id
+
+        result = await request.send()
+        return _ml_status_to_dict(result.status)
+
+    def poll_ml_training_status(
+        self,
+        task_id: str,
+        on_update: Optional[Callable[[Dict], None]] = None,
+        initial: float = 0.1,
+        max_interval: float = 5.0,
+        timeout: Optional[float] = None,
+    ) -> Optional[Dict]:
+        """Wait for an ML training task to finish, polling its status with backoff.
+
+        Polls back off as in poll_compute_job while the current epoch and
+        completed workers stay the same. The task counts as finished once
+        currentEpoch reaches totalEpochs.
+
+        Args:
+            task_id: Task identifier
+            on_update: Called on the client's loop thread with each status
+                that differs from the previous one
+            initial: Delay in seconds after a status change
+            max_interval: Longest delay in seconds between polls
+            timeout: Give up after this many seconds (None waits forever)
+
+        Returns:
+            The final training status dict, or None on error or timeout
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
 
+        future = self._submit(
+            self.poll_ml_training_status_async(
+                task_id, on_update, initial, max_interval, timeout
+            )
+        )
         try:
-            future = asyncio.run_coroutine_threadsafe(_async_get_status(), self._loop)
-            return future.result(timeout=5.0)
+            return future.result()
         except Exception as e:
-            logger.error(f"Error getting ML training status: {e}")
+            logger.error(f"Error polling ML training task {task_id}: {e}")
             return None
+
+    async def poll_ml_training_status_async(
+        self,
+        task_id: str,
+        on_update: Optional[Callable[[Dict], None]] = None,
+        initial: float = 0.1,
+        max_interval: float = 5.0,
+        timeout: Optional[float] = None,
+    ) -> Dict:
+        """Wait for an ML training task to finish on the connection's event loop."""
+        if not self._connected:
+            raise RuntimeError("Not connected to Go node")
+
+        return await asyncio.wait_for(
+            self._poll(
+                functools.partial(self.get_ml_training_status_async, task_id),
+                lambda status: (status["currentEpoch"], status["completedWorkers"]),
+                lambda status: 0 < status["totalEpochs"] <= status["currentEpoch"],
+                on_update,
+                initial,
+                max_interval,
+            ),
+            timeout,
+        )
@@ -0,0 +1,142 @@
+"""
+Connection pool of Cap'n Proto clients for a single Go node.
+Spreads RPCs over several sockets so one large transfer does not delay others.
+"""
+
+import functools
+import itertools
+import logging
+import os
+import sys
+import threading
+from typing import Optional, List, Any
+
+from .go_client import GoNodeClient
+
+logger = logging.getLogger(__name__)
+
+# Free-threaded builds (3.13t+) can run several event loops in parallel
+_FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class GoNodeClientPool:
+    """
+    Pool of GoNodeClient connections to one Go node.
+
+    Exposes the same blocking methods as GoNodeClient. Regular RPCs are
+    spread over the connections round-robin; bulk data calls (CES, upload,
+    download) go to the connection with the fewest bulk calls in flight, so
+    a large transfer never sits in front of small requests on the same socket.
+    Fire-and-forget senders (the *_nowait methods) always use the first
+    connection, so queued messages to a peer keep their order.
+
+    The clients share one result cache, so a write through one connection
+    invalidates cached reads on all of them.
+
+    On free-threaded Python each connection gets its own loop thread and
+    the pool defaults to one connection per CPU core. Regular RPCs are then
+    routed by calling thread instead, so each caller thread stays on one
+    loop and the connections handle their RPCs in parallel.
+    """
+
+    # Methods that move large payloads and are routed by least-outstanding
+    _BULK_METHODS = frozenset(
+        {"ces_process", "ces_process_into", "ces_reconstruct", "upload", "download"}
+    )
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 8080,
+        schema_path: Optional[str] = None,
+        size: Optional[int] = None,
+    ):
+        """
+        Initialize Go node client pool.
+
+        Args:
+            host: Go node host address
+            port: Go node RPC port (default 8080)
+            schema_path: Path to schema.capnp file (if None, uses absolute path from project root)
+            size: Number of connections to open (conn_pool_max_size); defaults
+                to 4, or to the CPU count on free-threaded Python
+        """
+        if size is None:
+            size = (os.cpu_count() or 4) if _FREE_THREADED else 4
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        # With the GIL every loop thread would take turns anyway, so the
+        # connections share the default loop unless threads run in parallel
+        self._clients: List[GoNodeClient] = [
+            GoNodeClient(host, port, schema_path, loop_index=i if _FREE_THREADED else 0)
+            for i in range(size)
+        ]
+        cache = self._clients[0]._cache
+        cache_lock = self._clients[0]._cache_lock
+        for client in self._clients[1:]:
+            client._cache = cache
+            client._cache_lock = cache_lock
+        self._rr = itertools.count()
+        self._affinity = threading.local()
+        self._bulk_outstanding: List[int] = [0] * size
+        self._bulk_lock: threading.Lock = threading.Lock()
+
+    def connect(self) -> bool:
+        """Connect every pooled client. Returns True if all connected."""
+        if all(client.connect() for client in self._clients):
+            return True
+        logger.error("Failed to connect client pool to Go node")
+        self.disconnect()
+        return False
+
+    def disconnect(self):
+        """Disconnect every pooled client."""
+        for client in self._clients:
+            if client.is_connected():
+                client.disconnect()
+
+    def is_connected(self) -> bool:
+        """Check if every pooled client is connected to the Go node."""
+        return all(client.is_connected() for client in self._clients)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only forward public blocking GoNodeClient methods; the *_async ones
+        # must be awaited on the loop of the client that owns the connection
+        if (
+            name.startswith("_")
+            or name.endswith("_async")
+            or not callable(getattr(GoNodeClient, name, None))
+        ):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        if name in self._BULK_METHODS:
+            return functools.partial(self._call_bulk, name)
+        if name.endswith("_nowait"):
+            # Each client has its own outbox; one outbox keeps sends ordered
+            return getattr(self._clients[0], name)
+        return getattr(self._pick(), name)
+
+    def _pick(self) -> GoNodeClient:
+        """Pick the client for a regular RPC."""
+        if not _FREE_THREADED:
+            return self._clients[next(self._rr) % len(self._clients)]
+        # Each caller thread keeps the client it was first given
+        index = getattr(self._affinity, "index", None)
+        if index is None:
+            index = self._affinity.index = next(self._rr) % len(self._clients)
+        return self._clients[index]
+
+    def _call_bulk(self, name: str, *args, **kwargs) -> Any:
+        """Run a bulk data method on the least busy connection."""
+        with self._bulk_lock:
+            index = min(
+                range(len(self._clients)), key=self._bulk_outstanding.__getitem__
+            )
+            self._bulk_outstanding[index] += 1
+        try:
+            return getattr(self._clients[index], name)(*args, **kwargs)
+        finally:
+            with self._bulk_lock:
+                self._bulk_outstanding[index] -= 1
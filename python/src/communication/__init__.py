@@ -6,9 +6,24 @@ The actual P2P communication is handled by Go's libp2p implementation.
 See docs/COMMUNICATION.md for details.
 """
 
-from .live_chat import main as chat_main
-from .live_voice import main as voice_main
-from .live_video import main as video_main
+import importlib
+
+# Entry points are imported on first use, so importing this package does not
+# load the reference implementations (and cv2/numpy for video and voice)
+_MAIN_MODULES = {
+    "chat_main": ".live_chat",
+    "voice_main": ".live_voice",
+    "video_main": ".live_video",
+}
 
 # Explicit exports for clarity and to silence unused-import warnings from linters
 __all__ = ["chat_main", "voice_main", "video_main"]
+
+
+def __getattr__(name):
+    module = _MAIN_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    main = importlib.import_module(module, __name__).main
+    globals()[name] = main
+    return main
@@ -20,24 +20,107 @@ For actual P2P chat, use the Go-based communication service:
 See docs/COMMUNICATION.md for full documentation.
 """
 
+import codecs
+import os
+import selectors
 import socket
 import threading
 import sys
 
+# One recv() call drains everything the peer has sent so far
+RECV_BUFFER_SIZE = 65536
+
+
+def _utf8_decoder():
+    """Decoder for received bytes that keeps characters split across reads."""
+    return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
 
 def receive_messages(sock):
+    decoder = _utf8_decoder()
     while True:
         try:
-            data = sock.recv(1024)
+            data = sock.recv(RECV_BUFFER_SIZE)
             if not data:
                 print("\n[Peer disconnected]")
                 break
-            print(f"\n📨 Peer: {data.decode('utf-8')}")
+            print(f"\n📨 Peer: {decoder.decode(data)}")
             print("You: ", end="", flush=True)
         except Exception:
             break
 
 
+def chat_loop(sock):
+    """Relay stdin lines to the peer and print its messages on one thread."""
+    stdin_fd = sys.stdin.fileno()
+    selector = selectors.DefaultSelector()
+    selector.register(sock, selectors.EVENT_READ)
+    selector.register(stdin_fd, selectors.EVENT_READ)
+    recv_buf = bytearray(RECV_BUFFER_SIZE)
+    recv_view = memoryview(recv_buf)
+    decoder = _utf8_decoder()
+    # Typed input not yet terminated by a newline
+    partial = b""
+    try:
+        print("You: ", end="", flush=True)
+        while True:
+            for key, _ in selector.select():
+                if key.fileobj is sock:
+                    try:
+                        n = sock.recv_into(recv_buf)
+                    except OSError:
+                        n = 0
+                    if not n:
+                        print("\n[Peer disconnected]")
+                        return
+                    print(f"\n📨 Peer: {decoder.decode(recv_view[:n])}")
+                else:
+                    # Read stdin unbuffered so a pasted block cannot sit in a
+                    # Python buffer that select() does not see
+                    data = os.read(stdin_fd, RECV_BUFFER_SIZE)
+                    if not data:
+                        print("\n[Connection closed]")
+                        return
+                    *lines, partial = (partial + data).split(b"\n")
+                    outgoing = []
+                    for line in lines:
+                        if line.lower() == b"quit":
+                            break
+                        outgoing.append(line)
+                    # All complete lines go out in one send
+                    if outgoing:
+                        try:
+                            sock.sendall(b"\n".join(outgoing))
+                        except OSError:
+                            print("\n[Peer disconnected]")
+                            return
+                    if len(outgoing) < len(lines):
+                        return
+                print("You: ", end="", flush=True)
+    finally:
+        selector.close()
+
+
+def threaded_chat_loop(sock):
+    """Chat loop for Windows, where stdin cannot be passed to select()."""
+    receiver = threading.Thread(target=receive_messages, args=(sock,), daemon=True)
+    receiver.start()
+
+    while True:
+        try:
+            msg = input("You: ")
+        except EOFError:
+            print("\n[Connection closed]")
+            break
+        if msg.lower() == "quit":
+            break
+        try:
+            sock.sendall(msg.encode("utf-8"))
+        except OSError:
+            print("\n[Peer disconnected]")
+            break
+
+
 def main():
     is_server = sys.argv[1].lower() == "true" if len(sys.argv) > 1 else False
     peer_ip = sys.argv[2] if len(sys.argv) > 2 else ""
@@ -66,22 +149,16 @@ def main():
             print("Make sure the other device started first!")
             sys.exit(1)
 
-    # Start receiver thread
-    receiver = threading.Thread(target=receive_messages, args=(sock,), daemon=True)
-    receiver.start()
+    # Send each typed line straight away instead of letting Nagle hold it
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
     print("\n💬 Chat started! Type messages and press Enter.\n")
 
     try:
-        while True:
-            try:
-                msg = input("You: ")
-            except EOFError:
-                print("\n[Connection closed]")
-                break
-            if msg.lower() == "quit":
-                break
-            sock.send(msg.encode("utf-8"))
+        if sys.platform == "win32":
+            threaded_chat_loop(sock)
+        else:
+            chat_loop(sock)
     except KeyboardInterrupt:
         print("\n[Chat ended]")
     finally:
@@ -27,6 +27,9 @@ See docs/COMMUNICATION.md for full documentation.
 
 import cv2
 import socket
+from bisect import bisect_left
+from collections import deque
+from itertools import islice
 import threading
 import struct
 import numpy as np
@@ -44,45 +47,55 @@ running = True
 class DynamicFrameRateAdapter:
     """Dynamically adjust frame rate and quality based on network conditions."""
 
+    # Bandwidth tiers (Mbps) and the (jpeg_quality, frame_skip) for each
+    BANDWIDTH_THRESHOLDS_MBPS = (0.5, 1, 2, 5)
+    TIER_SETTINGS = (
+        (30, 3),  # <0.5 Mbps: minimal quality, send every 4th frame
+        (40, 2),  # 0.5-1 Mbps: low quality, send every 3rd frame
+        (50, 1),  # 1-2 Mbps: lower quality, send every 2nd frame
+        (70, 0),  # 2-5 Mbps: medium quality
+        (85, 0),  # >5 Mbps: high quality, no skipping
+    )
+
     def __init__(self):
         self.jpeg_quality = 60  # 0-100
         self.frame_skip = 0  # Skip every Nth frame
         self.target_fps = 30
-        self.send_times = []  # Track send times for bandwidth estimation
-        self.last_adjustment = time.time()
-        self.adjustment_interval = 2.0  # Adjust every 2 seconds
+        # (size, monotonic ns) of the last 100 sends, for bandwidth estimation
+        self.send_times = deque(maxlen=100)
+        self.last_adjustment = time.monotonic_ns()
+        self.adjustment_interval_ns = 2_000_000_000  # Adjust every 2 seconds
 
     def record_send(self, size_bytes, duration_sec):
         """Record a frame send operation."""
-        self.send_times.append(
-            {"size": size_bytes, "time": time.time(), "duration": duration_sec}
-        )
-        # Keep last 100 sends
-        if len(self.send_times) > 100:
-            self.send_times.pop(0)
+        self.send_times.append((size_bytes, time.monotonic_ns()))
 
     def estimate_bandwidth_mbps(self):
         """Estimate current bandwidth in Mbps."""
         if len(self.send_times) < 5:
             return None
 
-        recent = self.send_times[-10:]  # Last 10 sends
-        total_bytes = sum(s["size"] for s in recent)
-        total_time = recent[-1]["time"] - recent[0]["time"]
+        # Last 10 sends, newest first
+        recent = list(islice(reversed(self.send_times), 10))
+        total_bytes = sum(size for size, _ in recent)
+        total_time_ns = recent[0][1] - recent[-1][1]
 
-        if total_time <= 0:
+        if total_time_ns <= 0:
             return None
 
-        mbps = (total_bytes * 8) / (total_time * 1_000_000)
+        # bits per ns * 1000 = Mbps
+        mbps = (total_bytes * 8_000) / total_time_ns
         return mbps
 
     def should_adjust(self):
         """Check if it's time to adjust parameters."""
-        return (time.time() - self.last_adjustment) > self.adjustment_interval
+        return (
+            time.monotonic_ns() - self.last_adjustment
+        ) > self.adjustment_interval_ns
 
     def adjust_for_bandwidth(self, bandwidth_mbps):
         """Adjust quality and skip rate based on bandwidth."""
-        self.last_adjustment = time.time()
+        self.last_adjustment = time.monotonic_ns()
 
         if bandwidth_mbps is None:
             return
@@ -90,22 +103,9 @@ class DynamicFrameRateAdapter:
         old_quality = self.jpeg_quality
         old_skip = self.frame_skip
 
-        # Adapt to bandwidth
-        if bandwidth_mbps > 5:  # >5 Mbps: high quality, no skipping
-            self.jpeg_quality = 85
-            self.frame_skip = 0
-        elif bandwidth_mbps > 2:  # 2-5 Mbps: medium quality
-            self.jpeg_quality = 70
-            self.frame_skip = 0
-        elif bandwidth_mbps > 1:  # 1-2 Mbps: lower quality
-            self.jpeg_quality = 50
-            self.frame_skip = 1  # Send every 2nd frame
-        elif bandwidth_mbps > 0.5:  # 0.5-1 Mbps: low quality, skip more
-            self.jpeg_quality = 40
-            self.frame_skip = 2  # Send every 3rd frame
-        else:  # <0.5 Mbps: minimal quality
-            self.jpeg_quality = 30
-            self.frame_skip = 3  # Send every 4th frame
+        # A bandwidth exactly on a threshold falls into the lower tier
+        tier = bisect_left(self.BANDWIDTH_THRESHOLDS_MBPS, bandwidth_mbps)
+        self.jpeg_quality, self.frame_skip = self.TIER_SETTINGS[tier]
 
         if old_quality != self.jpeg_quality or old_skip != self.frame_skip:
             print(
@@ -24,69 +24,163 @@ See docs/COMMUNICATION.md for full documentation.
 
 import cv2
 import asyncio
+import functools
 import struct
 import numpy as np
 import sys
 import time
 import socket
-from queue import Queue, Empty, Full
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any
 
+
+class LatestFrame:
+    """Single-slot mailbox that only keeps the newest frame.
+
+    Producers and the display loop all run on the event loop thread, so no
+    locking is needed.
+    """
+
+    __slots__ = ("_frame", "on_put")
+
+    def __init__(self):
+        self._frame: Any = None
+        # Called after each put() so the display loop can wake up
+        self.on_put: Any = None
+
+    def put(self, frame):
+        """Store a frame, replacing any frame not yet displayed."""
+        self._frame = frame
+        if self.on_put is not None:
+            self.on_put()
+
+    def take(self):
+        """Return the newest frame (or None) and empty the slot."""
+        frame = self._frame
+        self._frame = None
+        return frame
+
+
 # Global state
-received_frames: Queue[Any] = Queue(maxsize=30)
-local_frames: Queue[Any] = Queue(maxsize=30)
+received_frames = LatestFrame()  # Encoded JPEG, decoded when displayed
+local_frames = LatestFrame()
 running = True
 
+# Longest the display loop waits for a frame before pumping GUI events
+DISPLAY_IDLE_TIMEOUT = 0.03
+
 # UDP settings
 UDP_PORT = 9996
-MAX_DGRAM_SIZE = 65000  # Max UDP payload (leave room for headers)
+# Payload per datagram, sized so header + UDP/IP headers fit a 1500-byte
+# Ethernet MTU. Larger datagrams get IP-fragmented, and losing any one
+# fragment drops the whole datagram.
+MAX_DGRAM_SIZE = 1400
+SOCKET_BUFFER_SIZE = 8 * 1024 * 1024  # Absorb 30 FPS frame bursts
 MAX_FRAME_SIZE = 10 * 1024 * 1024  # 10MB limit
+# Most data packets a frame within MAX_FRAME_SIZE can be split into
+MAX_FRAME_PACKETS = -(-MAX_FRAME_SIZE // MAX_DGRAM_SIZE)
+FRAME_TIMEOUT = 1.0  # Seconds an incomplete frame is kept
+FRAME_EXPIRE_INTERVAL = 0.25  # Seconds between expiry sweeps
+
+# Packet header: frame_id (4) + total_packets (4) + packet_num (4) + data_size (4)
+# A multi-packet frame is followed by one XOR parity packet with
+# packet_num == total_packets, whose data_size is the whole frame's length.
+PACKET_HEADER = struct.Struct(">IIII")
 
 # Target resolution
 TARGET_WIDTH = 640
 TARGET_HEIGHT = 480
 
 
+@functools.lru_cache(maxsize=1)
+def _turbojpeg() -> Any:
+    """Return a shared PyTurboJPEG codec, or None if it is unavailable."""
+    try:
+        from turbojpeg import TurboJPEG
+
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        # Module not installed, or libturbojpeg not found
+        return None
+
+
+def encode_jpeg(frame, quality):
+    """JPEG-encode a BGR frame with libjpeg-turbo's SIMD codec, or OpenCV."""
+    codec = _turbojpeg()
+    if codec is not None:
+        from turbojpeg import TJSAMP_420
+
+        # 4:2:0 matches what cv2.imencode produces
+        return codec.encode(frame, quality=quality, jpeg_subsample=TJSAMP_420)
+
+    _, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    # View the encoded ndarray's buffer instead of copying it with tobytes()
+    return memoryview(encoded).cast("B")
+
+
+def xor_parity(frame_data, total_packets):
+    """XOR of a frame's fragments, each zero-padded to MAX_DGRAM_SIZE."""
+    padded = np.zeros(total_packets * MAX_DGRAM_SIZE, dtype=np.uint8)
+    padded[: len(frame_data)] = np.frombuffer(frame_data, dtype=np.uint8)
+    parity = np.bitwise_xor.reduce(padded.reshape(total_packets, MAX_DGRAM_SIZE))
+    return memoryview(parity)
+
+
+def decode_jpeg(data):
+    """Decode a JPEG into a BGR frame with libjpeg-turbo, or OpenCV."""
+    codec = _turbojpeg()
+    if codec is not None:
+        return codec.decode(data)
+    return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+
+
 class DynamicFrameRateAdapter:
     """Dynamically adjust frame rate and quality based on network conditions."""
 
+    # Bandwidth tiers (Mbps) and the (jpeg_quality, frame_skip) for each
+    BANDWIDTH_THRESHOLDS_MBPS = (0.5, 1, 2, 5)
+    TIER_SETTINGS = ((30, 3), (40, 2), (50, 1), (70, 0), (85, 0))
+
     def __init__(self):
         self.jpeg_quality = 60
         self.frame_skip = 0
-        self.send_times = []
-        self.last_adjustment = time.time()
-        self.adjustment_interval = 2.0
+        self.send_times = deque(maxlen=100)  # (size, monotonic ns) per send
+        self.last_adjustment = time.monotonic_ns()
+        self.adjustment_interval_ns = 2_000_000_000
 
     def record_send(self, size_bytes, duration_sec):
         """Record a frame send operation."""
-        self.send_times.append(
-            {"size": size_bytes, "time": time.time(), "duration": duration_sec}
-        )
-        if len(self.send_times) > 100:
-            self.send_times.pop(0)
+        self.send_times.append((size_bytes, time.monotonic_ns()))
 
     def estimate_bandwidth_mbps(self):
         """Estimate current bandwidth in Mbps."""
         if len(self.send_times) < 5:
             return None
 
-        recent = self.send_times[-10:]
-        total_bytes = sum(s["size"] for s in recent)
-        total_time = recent[-1]["time"] - recent[0]["time"]
+        # Last 10 sends, newest first
+        recent = list(islice(reversed(self.send_times), 10))
+        total_bytes = sum(size for size, _ in recent)
+        total_time_ns = recent[0][1] - recent[-1][1]
 
-        if total_time <= 0:
+        if total_time_ns <= 0:
             return None
 
-        mbps = (total_bytes * 8) / (total_time * 1_000_000)
+        # bits per ns * 1000 = Mbps
+        mbps = (total_bytes * 8_000) / total_time_ns
         return mbps
 
     def should_adjust(self):
         """Check if it's time to adjust parameters."""
-        return (time.time() - self.last_adjustment) > self.adjustment_interval
+        return (
+            time.monotonic_ns() - self.last_adjustment
+        ) > self.adjustment_interval_ns
 
     def adjust_for_bandwidth(self, bandwidth_mbps):
         """Adjust quality and skip rate based on bandwidth."""
-        self.last_adjustment = time.time()
+        self.last_adjustment = time.monotonic_ns()
 
         if bandwidth_mbps is None:
             return
@@ -94,21 +188,9 @@ class DynamicFrameRateAdapter:
         old_quality = self.jpeg_quality
         old_skip = self.frame_skip
 
-        if bandwidth_mbps > 5:
-            self.jpeg_quality = 85
-            self.frame_skip = 0
-        elif bandwidth_mbps > 2:
-            self.jpeg_quality = 70
-            self.frame_skip = 0
-        elif bandwidth_mbps > 1:
-            self.jpeg_quality = 50
-            self.frame_skip = 1
-        elif bandwidth_mbps > 0.5:
-            self.jpeg_quality = 40
-            self.frame_skip = 2
-        else:
-            self.jpeg_quality = 30
-            self.frame_skip = 3
+        # A bandwidth exactly on a threshold falls into the lower tier
+        tier = bisect_left(self.BANDWIDTH_THRESHOLDS_MBPS, bandwidth_mbps)
+        self.jpeg_quality, self.frame_skip = self.TIER_SETTINGS[tier]
 
         if old_quality != self.jpeg_quality or old_skip != self.frame_skip:
             print(
@@ -124,105 +206,157 @@ class DynamicFrameRateAdapter:
         return self.jpeg_quality
 
 
-async def receiver_task(sock, peer_addr=None):
-    """Receive video frames via UDP."""
-    global running
-    frame_count = 0
-    start_time = time.time()
-    frame_buffer = {}  # Buffer for multi-packet frames
+class VideoReceiverProtocol(asyncio.DatagramProtocol):
+    """Reassemble and decode video frames as datagrams arrive."""
 
-    print("📺 UDP Receiver started")
+    def __init__(self):
+        self.frame_count = 0
+        self.start_time = time.time()
+        self.frame_buffer = {}  # Buffer for multi-packet frames
+        self._expire_handle = None
+
+    def connection_made(self, transport):
+        self._expire_handle = asyncio.get_running_loop().call_later(
+            FRAME_EXPIRE_INTERVAL, self._expire_frames
+        )
 
-    loop = asyncio.get_event_loop()
+    def connection_lost(self, exc):
+        if self._expire_handle is not None:
+            self._expire_handle.cancel()
+            self._expire_handle = None
+
+    def _expire_frames(self):
+        """Drop frames older than FRAME_TIMEOUT and reschedule.
+
+        Frames are kept in arrival order, so only expired entries at the
+        front are visited.
+        """
+        frame_buffer = self.frame_buffer
+        current_time = time.time()
+        while frame_buffer:
+            oldest = next(iter(frame_buffer))
+            if current_time - frame_buffer[oldest]["timestamp"] <= FRAME_TIMEOUT:
+                break
+            del frame_buffer[oldest]
 
-    try:
-        while running:
-            try:
-                # Non-blocking receive
-                data, addr = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None, lambda: sock.recvfrom(MAX_DGRAM_SIZE + 100)
-                    ),
-                    timeout=0.5,
-                )
+        self._expire_handle = asyncio.get_running_loop().call_later(
+            FRAME_EXPIRE_INTERVAL, self._expire_frames
+        )
 
-                if len(data) < 16:
-                    continue
+    def datagram_received(self, data, addr):
+        if len(data) < 16:
+            return
 
-                # Parse header: frame_id (4) + total_packets (4) + packet_num (4) + data_size (4)
-                frame_id, total_packets, packet_num, data_size = struct.unpack(
-                    ">IIII", data[:16]
-                )
-                packet_data = data[16:]
-
-                # Initialize frame buffer if new frame
-                if frame_id not in frame_buffer:
-                    frame_buffer[frame_id] = {
-                        "packets": {},
-                        "total": total_packets,
-                        "timestamp": time.time(),
-                    }
-
-                # Store packet
-                frame_buffer[frame_id]["packets"][packet_num] = packet_data
-
-                # Check if frame is complete
-                if len(frame_buffer[frame_id]["packets"]) == total_packets:
-                    # Reassemble frame
-                    frame_data = b""
-                    for i in range(total_packets):
-                        if i in frame_buffer[frame_id]["packets"]:
-                            frame_data += frame_buffer[frame_id]["packets"][i]
-
-                    # Decode JPEG
-                    try:
-                        frame = cv2.imdecode(
-                            np.frombuffer(frame_data, np.uint8), cv2.IMREAD_COLOR
-                        )
-                        if frame is not None:
-                            frame_count += 1
-                            try:
-                                received_frames.put_nowait(frame)
-                            except Full:
-                                try:
-                                    received_frames.get_nowait()
-                                    received_frames.put_nowait(frame)
-                                except Exception:
-                                    pass
-
-                            if frame_count % 100 == 0:
-                                elapsed = time.time() - start_time
-                                fps = frame_count / elapsed if elapsed > 0 else 0
-                                print(
-                                    f"[UDP Receiver] {frame_count} frames | FPS: {fps:.1f}"
-                                )
-                    except Exception:
-                        pass
-
-                    # Remove completed frame
-                    del frame_buffer[frame_id]
-
-                # Clean old incomplete frames (older than 1 second)
-                current_time = time.time()
-                old_frames = [
-                    fid
-                    for fid, fdata in frame_buffer.items()
-                    if current_time - fdata["timestamp"] > 1.0
-                ]
-                for fid in old_frames:
-                    del frame_buffer[fid]
+        frame_id, total_packets, packet_num, data_size = PACKET_HEADER.unpack_from(data)
+        # The header comes off the network: bound total_packets before it
+        # sizes the fragment list. packet_num == total_packets is the parity
+        # packet; anything beyond it is invalid.
+        if not 0 < total_packets <= MAX_FRAME_PACKETS or packet_num > total_packets:
+            return
+        packet_data = memoryview(data)[PACKET_HEADER.size :]
+        frame_buffer = self.frame_buffer
+
+        # Initialize frame buffer if new frame
+        fdata = frame_buffer.get(frame_id)
+        if fdata is None:
+            fdata = frame_buffer[frame_id] = {
+                "packets": [None] * total_packets,
+                "received": 0,
+                "total_size": 0,
+                "parity": None,
+                "frame_size": 0,
+                "done": False,
+                "timestamp": time.time(),
+            }
+        elif fdata["done"]:
+            # Late parity or duplicate for a frame already shown
+            return
 
-            except asyncio.TimeoutError:
-                continue
-            except Exception:
-                if running:
-                    await asyncio.sleep(0.01)
+        packets = fdata["packets"]
+        if packet_num == len(packets):
+            # Parity packet
+            if fdata["parity"] is not None or data_size > MAX_FRAME_SIZE:
+                return
+            fdata["parity"] = packet_data
+            fdata["frame_size"] = data_size
+        else:
+            # Store packet (ignoring duplicates)
+            if packet_num > len(packets) or packets[packet_num] is not None:
+                return
+            packets[packet_num] = packet_data
+            fdata["received"] += 1
+            fdata["total_size"] += len(packet_data)
+            if fdata["total_size"] > MAX_FRAME_SIZE:
+                del frame_buffer[frame_id]
+                return
+
+        # A single lost fragment is rebuilt from the parity packet
+        if fdata["received"] == len(packets) - 1 and fdata["parity"] is not None:
+            self._recover_fragment(fdata)
+
+        # Check if frame is complete
+        if fdata["received"] == len(packets):
+            # Reassemble frame in a single copy. The JPEG is decoded by the
+            # display loop, so a frame replaced before it is shown is never
+            # decoded.
+            received_frames.put(b"".join(packets))
+            self.frame_count += 1
+
+            if self.frame_count % 100 == 0:
+                elapsed = time.time() - self.start_time
+                fps = self.frame_count / elapsed if elapsed > 0 else 0
+                print(f"[UDP Receiver] {self.frame_count} frames | FPS: {fps:.1f}")
+
+            # Keep a marker until it expires so the trailing parity packet
+            # does not start a new partial frame
+            fdata["done"] = True
+            fdata["packets"] = fdata["parity"] = None
+
+    @staticmethod
+    def _recover_fragment(fdata):
+        """Rebuild the one missing fragment by XOR-ing parity with the rest."""
+        packets = fdata["packets"]
+        missing = packets.index(None)
+        recovered = np.frombuffer(fdata["parity"], dtype=np.uint8).copy()
+        for fragment in packets:
+            if fragment is not None:
+                recovered[: len(fragment)] ^= np.frombuffer(fragment, dtype=np.uint8)
+
+        if missing == len(packets) - 1:
+            size = fdata["frame_size"] - missing * MAX_DGRAM_SIZE
+        else:
+            size = MAX_DGRAM_SIZE
+        if not 0 < size <= len(recovered):
+            return
+        packets[missing] = memoryview(recovered)[:size]
+        fdata["received"] += 1
+
+    def error_received(self, exc):
+        # ICMP errors (e.g. peer not yet listening) are expected on UDP
+        pass
+
+
+async def receiver_task(sock, peer_addr=None):
+    """Receive video frames via UDP."""
+    print("📺 UDP Receiver started")
+
+    loop = asyncio.get_running_loop()
+    # Datagrams are handled directly on the event loop when the socket is
+    # readable, instead of one executor round trip per packet
+    transport, protocol = await loop.create_datagram_endpoint(
+        VideoReceiverProtocol, sock=sock
+    )
 
+    try:
+        while running:
+            await asyncio.sleep(0.5)
     except Exception as e:
         if running:
             print(f"[Receiver] Fatal: {e}")
     finally:
-        elapsed = time.time() - start_time
+        transport.close()
+        elapsed = time.time() - protocol.start_time
+        frame_count = protocol.frame_count
         fps = frame_count / elapsed if elapsed > 0 else 0
         print(f"📺 UDP Receiver stopped. {frame_count} frames at {fps:.1f} FPS")
 
@@ -235,6 +369,13 @@ async def sender_task(sock, peer_addr):
     adapter = DynamicFrameRateAdapter()
     cap = None
     start_time = time.time()
+    loop = asyncio.get_event_loop()
+    # JPEG encoding releases the GIL, so running it here keeps the event loop
+    # (receiver and display) responsive while a frame is being encoded
+    encoder_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jpeg")
+    # cap.read() blocks until the camera delivers the next frame, so it runs
+    # here and paces the loop instead of a polling sleep
+    capture_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture")
 
     try:
         cap = cv2.VideoCapture(0)
@@ -257,10 +398,28 @@ async def sender_task(sock, peer_addr):
                 f"📷 Camera provides {actual_width}x{actual_height}, will resize to {TARGET_WIDTH}x{TARGET_HEIGHT}"
             )
 
+        # Resize destination reused for every frame; the encoded bytes are
+        # copied out before the next resize overwrites it
+        send_buf = (
+            np.empty((TARGET_HEIGHT, TARGET_WIDTH, 3), dtype=np.uint8)
+            if needs_resize
+            else None
+        )
+
         frame_times = []
+        # Packet buffer reused for every packet, header packed at the front
+        packet_view = memoryview(bytearray(PACKET_HEADER.size + MAX_DGRAM_SIZE))
+        header_size = PACKET_HEADER.size
+        header = packet_view[:header_size]
+        pack_header = PACKET_HEADER.pack_into
+        # sendmsg() gathers header and payload without copying the payload
+        # (not available on Windows)
+        sendmsg = getattr(sock, "sendmsg", None)
+        # Adapter settings only change in adjust_for_bandwidth()
+        jpeg_quality = adapter.get_jpeg_quality()
 
         while running:
-            ret, frame = cap.read()
+            ret, frame = await loop.run_in_executor(capture_pool, cap.read)
             if not ret:
                 await asyncio.sleep(0.01)
                 continue
@@ -269,61 +428,77 @@ async def sender_task(sock, peer_addr):
             if len(frame_times) > 100:
                 frame_times.pop(0)
 
-            # Queue for local display
-            try:
-                display_frame = frame.copy()
-                h, w = display_frame.shape[:2]
-                if w > 1280 or h > 720:
-                    scale = min(1280 / w, 720 / h)
-                    display_frame = cv2.resize(
-                        display_frame, (int(w * scale), int(h * scale))
-                    )
-                local_frames.put_nowait(display_frame)
-            except Full:
-                try:
-                    local_frames.get_nowait()
-                    local_frames.put_nowait(display_frame)
-                except Exception:
-                    pass
-
-            # Resize for sending if needed
-            if needs_resize:
-                send_frame = cv2.resize(frame, (TARGET_WIDTH, TARGET_HEIGHT))
-            else:
-                send_frame = frame
+            # Queue for local display. cap.read() returns a fresh array each
+            # time and the display side only reads it, so no copy is needed.
+            display_frame = frame
+            h, w = display_frame.shape[:2]
+            if w > 1280 or h > 720:
+                scale = min(1280 / w, 720 / h)
+                display_frame = cv2.resize(frame, (int(w * scale), int(h * scale)))
+            local_frames.put(display_frame)
 
             # Encode and send
             if adapter.should_send_frame(frame_count):
+                # Resize for sending if needed (skipped frames are not resized)
+                if needs_resize:
+                    send_frame = cv2.resize(
+                        frame,
+                        (TARGET_WIDTH, TARGET_HEIGHT),
+                        dst=send_buf,
+                        interpolation=cv2.INTER_LINEAR,
+                    )
+                else:
+                    send_frame = frame
+
                 try:
                     send_start = time.time()
-                    _, encoded = cv2.imencode(
-                        ".jpg",
-                        send_frame,
-                        [cv2.IMWRITE_JPEG_QUALITY, adapter.get_jpeg_quality()],
+                    frame_data = await loop.run_in_executor(
+                        encoder_pool, encode_jpeg, send_frame, jpeg_quality
                     )
-                    frame_data = encoded.tobytes()
 
                     # Split into UDP packets
                     total_packets = (
                         len(frame_data) + MAX_DGRAM_SIZE - 1
                     ) // MAX_DGRAM_SIZE
 
+                    frame_view = memoryview(frame_data)
                     for packet_num in range(total_packets):
                         start_idx = packet_num * MAX_DGRAM_SIZE
-                        end_idx = min(start_idx + MAX_DGRAM_SIZE, len(frame_data))
-                        packet_data = frame_data[start_idx:end_idx]
+                        packet_data = frame_view[start_idx : start_idx + MAX_DGRAM_SIZE]
+                        packet_size = len(packet_data)
 
-                        # Header: frame_id (4) + total_packets (4) + packet_num (4) + data_size (4)
-                        header = struct.pack(
-                            ">IIII",
+                        pack_header(
+                            header,
+                            0,
                             frame_count,
                             total_packets,
                             packet_num,
-                            len(packet_data),
+                            packet_size,
                         )
-                        packet = header + packet_data
-
-                        sock.sendto(packet, peer_addr)
+                        if sendmsg is not None:
+                            sendmsg([header, packet_data], (), 0, peer_addr)
+                        else:
+                            packet_end = header_size + packet_size
+                            packet_view[header_size:packet_end] = packet_data
+                            sock.sendto(packet_view[:packet_end], peer_addr)
+
+                    # Parity lets the receiver rebuild any one lost fragment
+                    if total_packets > 1:
+                        parity = xor_parity(frame_data, total_packets)
+                        pack_header(
+                            header,
+                            0,
+                            frame_count,
+                            total_packets,
+                            total_packets,
+                            len(frame_data),
+                        )
+                        if sendmsg is not None:
+                            sendmsg([header, parity], (), 0, peer_addr)
+                        else:
+                            packet_end = header_size + len(parity)
+                            packet_view[header_size:packet_end] = parity
+                            sock.sendto(packet_view[:packet_end], peer_addr)
 
                     send_duration = time.time() - send_start
                     adapter.record_send(len(frame_data), send_duration)
@@ -331,6 +506,7 @@ async def sender_task(sock, peer_addr):
                     if adapter.should_adjust():
                         bw = adapter.estimate_bandwidth_mbps()
                         adapter.adjust_for_bandwidth(bw)
+                        jpeg_quality = adapter.get_jpeg_quality()
 
                     frame_count += 1
 
@@ -338,15 +514,13 @@ async def sender_task(sock, peer_addr):
                         elapsed = time.time() - start_time
                         total_fps = frame_count / elapsed if elapsed > 0 else 0
                         print(
-                            f"[UDP Sender] {frame_count} frames | FPS: {total_fps:.1f} | Quality: {adapter.get_jpeg_quality()}"
+                            f"[UDP Sender] {frame_count} frames | FPS: {total_fps:.1f} | Quality: {jpeg_quality}"
                         )
 
                 except Exception as e:
                     if running:
                         print(f"[Sender] Error: {e}")
 
-            await asyncio.sleep(0.001)
-
     except Exception as e:
         if running:
             print(f"[Sender] Fatal error: {e}")
@@ -355,7 +529,10 @@ async def sender_task(sock, peer_addr):
         fps = frame_count / elapsed if elapsed > 0 else 0
         print(f"📹 UDP Sender stopped. {frame_count} frames at {fps:.1f} FPS")
         if cap:
-            cap.release()
+            # Queued behind any read still in flight on the capture thread
+            capture_pool.submit(cap.release)
+        encoder_pool.shutdown(wait=False)
+        capture_pool.shutdown(wait=False)
 
 
 async def display_frames():
@@ -364,23 +541,33 @@ async def display_frames():
 
     print("\n🎥 UDP Video streaming active! Press 'q' to end.\n")
 
+    frame_ready = asyncio.Event()
+    local_frames.on_put = received_frames.on_put = frame_ready.set
+
     try:
         while running:
-            # Display local camera
+            # Sleep until a frame arrives; the timeout keeps the window
+            # responsive to key presses and redraws while the stream is idle
             try:
-                local_frame = local_frames.get_nowait()
-                cv2.imshow("Local Camera (UDP)", local_frame)
-            except Empty:
+                await asyncio.wait_for(frame_ready.wait(), DISPLAY_IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
                 pass
+            frame_ready.clear()
+
+            # Display local camera
+            local_frame = local_frames.take()
+            if local_frame is not None:
+                cv2.imshow("Local Camera (UDP)", local_frame)
 
             # Display received
-            try:
-                recv_frame = received_frames.get_nowait()
-                cv2.imshow("Peer Video (UDP)", recv_frame)
-            except Empty:
-                pass
-            except Exception:
-                pass
+            recv_jpeg = received_frames.take()
+            if recv_jpeg is not None:
+                try:
+                    recv_frame = decode_jpeg(recv_jpeg)
+                    if recv_frame is not None:
+                        cv2.imshow("Peer Video (UDP)", recv_frame)
+                except Exception:
+                    pass
 
             key = cv2.waitKey(1) & 0xFF
             if key == ord("q"):
@@ -388,12 +575,11 @@ async def display_frames():
                 running = False
                 break
 
-            await asyncio.sleep(0.001)
-
     except KeyboardInterrupt:
         print("\n[Main] Interrupted")
     finally:
         running = False
+        local_frames.on_put = received_frames.on_put = None
         cv2.destroyAllWindows()
         print("🎥 UDP Video call ended")
 
@@ -408,6 +594,9 @@ async def main():
     # Create UDP socket
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # The kernel caps these at net.core.{w,r}mem_max
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
     sock.setblocking(False)
 
     try:
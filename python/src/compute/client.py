@@ -5,14 +5,23 @@ This module provides the Python client for submitting and monitoring
 compute jobs via the Go orchestrator's Cap'n Proto RPC interface.
 """
 
+import asyncio
 import logging
+import multiprocessing
+import os
+import pickle
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import sys
 
+from .job import default_execute
+
 # Add parent for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -32,6 +41,15 @@ class TaskStatus(IntEnum):
     CANCELLED = 7
 
 
+# Lowercased Go status string to TaskStatus enum
+_TASK_STATUS_BY_NAME = {status.name.lower(): status for status in TaskStatus}
+
+# States after which the orchestrator does no more work on a job
+_FINAL_STATUSES = frozenset(
+    {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.TIMEOUT, TaskStatus.CANCELLED}
+)
+
+
 @dataclass
 class JobStatus:
     """Status of a compute job."""
@@ -56,6 +74,20 @@ class ComputeCapacity:
     bandwidth_mbps: float
 
 
+def _defined_in_main(fn: Any) -> bool:
+    """Check whether fn, or the kernel it wraps, is defined in __main__.
+
+    with_numba_execute wraps kernels in job._ArrayExecute, whose module is
+    always src.compute.job, and Numba dispatchers keep the Python function
+    in py_func, so both are unwrapped before checking.
+    """
+    while fn is not None:
+        if getattr(fn, "__module__", None) == "__main__":
+            return True
+        fn = getattr(fn, "kernel", None) or getattr(fn, "py_func", None)
+    return False
+
+
 class ComputeClient:
     """Client for distributed compute operations.
 
@@ -99,6 +131,17 @@ class ComputeClient:
         self._connected = False
         self._go_client: Optional[Any] = None
         self._jobs: Dict[str, Any] = {}
+        # Set once a job reaches a final local state (completed, failed,
+        # cancelled) so get_result() can wait without polling
+        self._completions: Dict[str, threading.Event] = {}
+        # Worker processes for local fallback execution, created on first use;
+        # the lock keeps concurrent fallbacks from each creating one
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # Finished job IDs in the order they finished, with the monotonic
+        # finish time; used to forget old jobs after _job_ttl seconds
+        self._finished: Dict[str, float] = {}
+        self._job_ttl = 3600.0
 
     def connect(self) -> bool:
         """Connect to the Go orchestrator via Cap'n Proto RPC.
@@ -123,6 +166,32 @@ class ComputeClient:
             logger.error(f"Failed to connect: {e}")
             return False
 
+    async def connect_async(self) -> bool:
+        """Connect to the Go orchestrator on the running event loop.
+
+        Must be awaited inside ``capnp.kj_loop()``; the *_async methods of
+        this client then await the RPCs directly on that loop.
+
+        Returns:
+            True if connected successfully
+        """
+        try:
+            from src.client.go_client import GoNodeClient
+
+            logger.info(f"Connecting to compute service at {self.host}:{self.port}")
+            self._go_client = GoNodeClient(self.host, self.port, self.schema_path)
+
+            if await self._go_client.connect_async():
+                self._connected = True
+                logger.info(f"✅ Connected to Go node at {self.host}:{self.port}")
+                return True
+            else:
+                logger.error(f"Failed to connect to Go node at {self.host}:{self.port}")
+                return False
+        except Exception as e:
+            logger.error(f"Failed to connect: {e}")
+            return False
+
     def disconnect(self):
         """Disconnect from the Go orchestrator."""
         if self._connected and self._go_client:
@@ -130,6 +199,10 @@ class ComputeClient:
             self._go_client.disconnect()
             self._connected = False
             self._go_client = None
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def is_connected(self) -> bool:
         """Check if client is connected."""
@@ -150,48 +223,148 @@ class ComputeClient:
             ConnectionError: If not connected
             RuntimeError: If job submission fails
         """
-        if not self._connected:
-            raise ConnectionError("Not connected to compute service")
+        return self.submit_jobs([(job_definition, input_data, kwargs)])[0]
 
-        # Convert job definition to manifest
-        manifest = job_definition.to_manifest(input_data, **kwargs)
-        job_id = manifest["jobId"]
+    def submit_jobs(self, jobs: List[Tuple[Any, bytes, Dict[str, Any]]]) -> List[str]:
+        """Submit several compute jobs to the Go orchestrator in one batch.
 
-        logger.info(f"Submitting job {job_id} with {len(input_data)} bytes of input")
+        The submissions are pipelined over the RPC connection, so N jobs cost
+        one round-trip. Jobs the orchestrator rejects fall back to local
+        execution individually.
+
+        Args:
+            jobs: (job_definition, input_data, kwargs) tuples, as for submit_job
 
-        # Store job locally for tracking
-        self._jobs[job_id] = {
-            "manifest": manifest,
-            "input_data": input_data,
-            "definition": job_definition,
-            "status": TaskStatus.PENDING,
-            "start_time": time.time(),
-            "result": None,
-        }
+        Returns:
+            The job IDs, in the same order as jobs
+
+        Raises:
+            ConnectionError: If not connected
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to compute service")
+
+        self._evict_expired_jobs()
+        job_ids, requests = self._register_jobs(jobs)
 
         # Submit to Go orchestrator via RPC
         go_client = self._go_client
         assert go_client is not None
 
-        success, error_msg = go_client.submit_compute_job(
-            job_id=job_id,
-            input_data=input_data,
-            split_strategy=manifest.get("splitStrategy", "fixed"),
-            min_chunk_size=manifest.get("minChunkSize", 1024),
-            max_chunk_size=manifest.get("maxChunkSize", 65536),
-            timeout_secs=manifest.get("timeoutSecs", 300),
-            priority=manifest.get("priority", 5),
-        )
+        results = go_client.submit_compute_jobs(requests)
 
-        if success:
-            logger.info(f"✅ Job {job_id} submitted to Go orchestrator")
-            self._jobs[job_id]["status"] = TaskStatus.ASSIGNED
-        else:
-            logger.warning(f"⚠️ Go orchestrator submission failed: {error_msg}")
-            logger.info(f"   Falling back to local execution for job {job_id}")
+        for job_id in self._record_submissions(job_ids, results):
             self._execute_locally(job_id)
 
-        return job_id
+        return job_ids
+
+    async def submit_job_async(
+        self, job_definition, input_data: bytes, **kwargs
+    ) -> str:
+        """Submit a compute job on the connection's event loop.
+
+        See submit_job. Requires connect_async().
+        """
+        job_ids = await self.submit_jobs_async([(job_definition, input_data, kwargs)])
+        return job_ids[0]
+
+    async def submit_jobs_async(
+        self, jobs: List[Tuple[Any, bytes, Dict[str, Any]]]
+    ) -> List[str]:
+        """Submit several compute jobs on the connection's event loop.
+
+        See submit_jobs. Requires connect_async(). Jobs falling back to local
+        execution run in a worker thread so the event loop is not blocked.
+        Many calls can be in flight at once, e.g.::
+
+            job_ids = await asyncio.gather(
+                *(client.submit_job_async(job, data) for job, data in work)
+            )
+            results = await asyncio.gather(
+                *(client.get_result_async(job_id) for job_id in job_ids)
+            )
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to compute service")
+
+        self._evict_expired_jobs()
+        job_ids, requests = self._register_jobs(jobs)
+
+        go_client = self._go_client
+        assert go_client is not None
+
+        try:
+            results = await go_client.submit_compute_jobs_async(requests)
+        except Exception as e:
+            results = [(False, str(e))] * len(job_ids)
+
+        loop = asyncio.get_running_loop()
+        for job_id in self._record_submissions(job_ids, results):
+            await loop.run_in_executor(None, self._execute_locally, job_id)
+
+        return job_ids
+
+    def _register_jobs(
+        self, jobs: List[Tuple[Any, bytes, Dict[str, Any]]]
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Build manifests and start tracking jobs before submission.
+
+        Returns:
+            The job IDs and the submit_compute_job(s) arguments for each job
+        """
+        requests = []
+        job_ids = []
+        for job_definition, input_data, kwargs in jobs:
+            manifest = job_definition.to_manifest(input_data, **kwargs)
+            job_id = manifest["jobId"]
+
+            logger.info(
+                f"Submitting job {job_id} with {len(input_data)} bytes of input"
+            )
+
+            self._jobs[job_id] = {
+                "manifest": manifest,  # manifest["inputData"] is the input
+                "definition": job_definition,
+                "status": TaskStatus.PENDING,
+                "start_time": time.time(),
+                "result": None,
+            }
+            self._completions[job_id] = threading.Event()
+            job_ids.append(job_id)
+            requests.append(
+                {
+                    "job_id": job_id,
+                    "input_data": input_data,
+                    "split_strategy": manifest.get("splitStrategy", "fixed"),
+                    "min_chunk_size": manifest.get("minChunkSize", 1024),
+                    "max_chunk_size": manifest.get("maxChunkSize", 65536),
+                    "timeout_secs": manifest.get("timeoutSecs", 300),
+                    "priority": manifest.get("priority", 5),
+                }
+            )
+        return job_ids, requests
+
+    def _record_submissions(
+        self, job_ids: List[str], results: List[Tuple[bool, str]]
+    ) -> List[str]:
+        """Mark accepted jobs as assigned.
+
+        Returns:
+            The IDs of rejected jobs, which must be executed locally
+        """
+        rejected = []
+        for job_id, (success, error_msg) in zip(job_ids, results):
+            if success:
+                logger.info(f"✅ Job {job_id} submitted to Go orchestrator")
+                job = self._jobs[job_id]
+                job["status"] = TaskStatus.ASSIGNED
+                # The orchestrator owns the input now; don't keep it alive
+                job["manifest"].pop("inputData", None)
+            else:
+                logger.warning(f"⚠️ Go orchestrator submission failed: {error_msg}")
+                logger.info(f"   Falling back to local execution for job {job_id}")
+                rejected.append(job_id)
+        return rejected
 
     def _execute_locally(self, job_id: str):
         """Execute job locally when Go orchestrator is unavailable.
@@ -200,7 +373,7 @@ class ComputeClient:
         """
         job = self._jobs[job_id]
         definition = job["definition"]
-        input_data = job["input_data"]
+        input_data = job["manifest"]["inputData"]
 
         try:
             # Split
@@ -212,8 +385,7 @@ class ComputeClient:
             # Execute each chunk
             print("   [LOCAL] EXECUTE phase...")
             results = []
-            for i, chunk in enumerate(chunks):
-                result = definition.execute(chunk)
+            for i, result in enumerate(self._map_chunks(definition, chunks)):
                 results.append(result)
                 print(f"   [LOCAL] Chunk {i+1}/{len(chunks)} completed")
 
@@ -232,6 +404,88 @@ class ComputeClient:
             job["error"] = str(e)
             logger.error(f"Job {job_id} failed: {e}")
 
+        finally:
+            # Set before marking: once marked, another thread may evict the job
+            self._completions[job_id].set()
+            self._mark_finished(job_id)
+
+    def _map_chunks(self, definition, chunks: List[Any]):
+        """Run the job's execute function over chunks, in parallel if possible.
+
+        CPU-bound mappers are spread over a process pool, bypassing the GIL.
+        Workers are spawned rather than forked, since a fork would copy this
+        process while the Cap'n Proto and asyncio loop threads are running.
+        Identity mappers, single chunks and functions the workers could not
+        load run serially in this process: those that cannot be pickled
+        (lambdas, closures such as those defined inside @Job.define) and
+        those defined in __main__, which spawned workers would have to
+        re-run the main script to find. If the pool breaks anyway, the
+        chunks are run serially instead. Results are returned in chunk order.
+        """
+        execute_fn = definition.execute_fn
+        if (
+            len(chunks) < 2
+            or execute_fn in (None, default_execute)
+            or _defined_in_main(execute_fn)
+        ):
+            return map(definition.execute, chunks)
+        try:
+            pickle.dumps(execute_fn)
+        except Exception:
+            return map(definition.execute, chunks)
+
+        # memoryview chunks (see split_views) cannot be pickled
+        chunks = [bytes(c) if isinstance(c, memoryview) else c for c in chunks]
+        workers = os.cpu_count() or 1
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            pool = self._pool
+        try:
+            return list(
+                pool.map(
+                    execute_fn, chunks, chunksize=max(1, len(chunks) // (4 * workers))
+                )
+            )
+        except BrokenProcessPool as e:
+            logger.warning(f"Process pool failed ({e}); running chunks in-process")
+            with self._pool_lock:
+                if self._pool is pool:
+                    self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            return map(definition.execute, chunks)
+
+    def set_job_ttl(self, seconds: float):
+        """Set how long finished jobs are remembered.
+
+        Completed, failed and cancelled jobs (with their results) are
+        dropped this many seconds after they finish, checked whenever jobs
+        are submitted or queried. A longer TTL keeps results available to
+        get_status/get_result for longer at the cost of holding them in
+        memory; cleanup_job() still drops a job immediately.
+
+        Args:
+            seconds: Time to keep finished jobs (default 3600)
+        """
+        self._job_ttl = seconds
+
+    def _mark_finished(self, job_id: str):
+        """Record when a job finished, starting its TTL."""
+        self._finished.pop(job_id, None)
+        self._finished[job_id] = time.monotonic()
+
+    def _evict_expired_jobs(self):
+        """Forget finished jobs older than the TTL, oldest first."""
+        finished = self._finished
+        now = time.monotonic()
+        while finished:
+            job_id = next(iter(finished))
+            if now - finished[job_id] <= self._job_ttl:
+                break
+            self.cleanup_job(job_id)
+
     def get_status(self, job_id: str) -> JobStatus:
         """Get the status of a job from Go orchestrator.
 
@@ -248,6 +502,7 @@ class ComputeClient:
         if not self._connected:
             raise ConnectionError("Not connected to compute service")
 
+        self._evict_expired_jobs()
         if job_id not in self._jobs:
             raise KeyError(f"Job {job_id} not found")
 
@@ -258,18 +513,12 @@ class ComputeClient:
         status_dict = go_client.get_compute_job_status(job_id)
 
         if status_dict:
-            # Map Go status string to TaskStatus enum
-            status_map = {
-                "pending": TaskStatus.PENDING,
-                "assigned": TaskStatus.ASSIGNED,
-                "computing": TaskStatus.COMPUTING,
-                "verifying": TaskStatus.VERIFYING,
-                "completed": TaskStatus.COMPLETED,
-                "failed": TaskStatus.FAILED,
-                "timeout": TaskStatus.TIMEOUT,
-                "cancelled": TaskStatus.CANCELLED,
-            }
-            status = status_map.get(status_dict["status"].lower(), TaskStatus.PENDING)
+            status = _TASK_STATUS_BY_NAME.get(
+                status_dict["status"].lower(), TaskStatus.PENDING
+            )
+            if status in _FINAL_STATUSES and job_id not in self._finished:
+                # Jobs whose result is never fetched still expire
+                self._mark_finished(job_id)
 
             return JobStatus(
                 job_id=job_id,
@@ -316,6 +565,8 @@ class ComputeClient:
         if job_id not in self._jobs:
             raise KeyError(f"Job {job_id} not found")
 
+        deadline = time.monotonic() + timeout
+
         # Try to get result from Go orchestrator first
         go_client = self._go_client
         assert go_client is not None
@@ -325,28 +576,75 @@ class ComputeClient:
         )
 
         if result_data:
+            self._mark_finished(job_id)
             return result_data, worker_node
 
         if error_msg:
             logger.warning(f"Go orchestrator result fetch failed: {error_msg}")
 
-        # Fallback to local result
-        start = time.time()
-        while time.time() - start < timeout:
-            job = self._jobs[job_id]
+        # Fallback to local result. Local jobs finish inside submit_job(), so
+        # this normally returns at once; otherwise wait for the job to be
+        # completed or cancelled for whatever is left of the timeout.
+        if not self._completions[job_id].wait(max(0.0, deadline - time.monotonic())):
+            raise TimeoutError(f"Timeout waiting for job {job_id}")
 
-            if job["status"] == TaskStatus.COMPLETED:
-                return job["result"], "local"
+        return self._local_result(job_id)
 
-            if job["status"] == TaskStatus.FAILED:
-                raise RuntimeError(f"Job failed: {job.get('error', 'Unknown error')}")
+    async def get_result_async(
+        self, job_id: str, timeout: float = 300.0
+    ) -> Tuple[bytes, str]:
+        """Get the result of a completed job on the connection's event loop.
 
-            if job["status"] == TaskStatus.CANCELLED:
-                raise RuntimeError("Job was cancelled")
+        See get_result. Requires connect_async().
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to compute service")
 
-            time.sleep(0.1)
+        if job_id not in self._jobs:
+            raise KeyError(f"Job {job_id} not found")
 
-        raise TimeoutError(f"Timeout waiting for job {job_id}")
+        deadline = time.monotonic() + timeout
+
+        go_client = self._go_client
+        assert go_client is not None
+
+        try:
+            result_data, error_msg, worker_node = (
+                await go_client.get_compute_job_result_async(
+                    job_id, timeout_ms=int(timeout * 1000)
+                )
+            )
+        except Exception as e:
+            result_data, error_msg, worker_node = None, str(e), ""
+
+        if result_data:
+            self._mark_finished(job_id)
+            return result_data, worker_node
+
+        if error_msg:
+            logger.warning(f"Go orchestrator result fetch failed: {error_msg}")
+
+        completion = self._completions[job_id]
+        if not completion.is_set():
+            # Only remote jobs still running get here; wait off the loop
+            remaining = max(0.0, deadline - time.monotonic())
+            loop = asyncio.get_running_loop()
+            if not await loop.run_in_executor(None, completion.wait, remaining):
+                raise TimeoutError(f"Timeout waiting for job {job_id}")
+
+        return self._local_result(job_id)
+
+    def _local_result(self, job_id: str) -> Tuple[bytes, str]:
+        """Return a locally finished job's result, raising if it did not complete."""
+        job = self._jobs[job_id]
+
+        if job["status"] == TaskStatus.COMPLETED:
+            return job["result"], "local"
+
+        if job["status"] == TaskStatus.FAILED:
+            raise RuntimeError(f"Job failed: {job.get('error', 'Unknown error')}")
+
+        raise RuntimeError("Job was cancelled")
 
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job via Go orchestrator.
@@ -369,6 +667,8 @@ class ComputeClient:
         if cancelled:
             if job_id in self._jobs:
                 self._jobs[job_id]["status"] = TaskStatus.CANCELLED
+                self._completions[job_id].set()
+                self._mark_finished(job_id)
             logger.info(f"Job {job_id} cancelled via Go orchestrator")
             return True
 
@@ -377,12 +677,18 @@ class ComputeClient:
             return False
 
         self._jobs[job_id]["status"] = TaskStatus.CANCELLED
+        self._completions[job_id].set()
+        self._mark_finished(job_id)
         logger.info(f"Job {job_id} cancelled locally")
         return True
 
     def get_capacity(self) -> ComputeCapacity:
         """Get the compute capacity of the connected node from Go orchestrator.
 
+        The RPC result is cached by GoNodeClient for a few seconds and
+        refreshed as soon as a job is submitted or cancelled through it, so
+        scheduler loops can call this freely.
+
         Returns:
             ComputeCapacity object
         """
@@ -427,6 +733,8 @@ class ComputeClient:
         Args:
             job_id: The job ID
         """
+        self._finished.pop(job_id, None)
         if job_id in self._jobs:
             del self._jobs[job_id]
+            del self._completions[job_id]
             logger.debug(f"Cleaned up job {job_id}")
@@ -10,7 +10,8 @@ Thread Safety:
 """
 
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+from typing import Any, Callable, List, Optional
+import functools
 import hashlib
 import logging
 import threading
@@ -21,6 +22,23 @@ logger = logging.getLogger(__name__)
 _thread_local = threading.local()
 
 
+@functools.lru_cache(maxsize=1)
+def _numba() -> Any:
+    """Return the numba module, or None if it is not installed.
+
+    Numba is optional: it JIT-compiles numeric execute functions opted in
+    via JobBuilder.with_numba_execute. Importing it initialises LLVM and
+    takes seconds, so it is imported on first use rather than with this
+    module.
+    """
+    try:
+        import numba
+
+        return numba
+    except ImportError:
+        return None
+
+
 @dataclass
 class JobDefinition:
     """Represents a complete job definition with split, execute, and merge functions."""
@@ -49,15 +67,15 @@ class JobDefinition:
         self.validate()
 
         # Calculate job ID from hash of definition + input
-        hasher = hashlib.sha256()
-        hasher.update(self.name.encode())
-        hasher.update(input_data[:1024])  # First 1KB for uniqueness
+        hasher = hashlib.sha256(self.name.encode())
+        # First 1KB for uniqueness, hashed through a view instead of a copy
+        hasher.update(memoryview(input_data)[:1024])
         job_id = hasher.hexdigest()[:16]
 
         return {
             "jobId": f"job-{job_id}",
             "wasmModule": self._serialize_functions(),
-            "inputData": list(input_data),  # Convert to list for JSON
+            "inputData": input_data,  # Sent as Cap'n Proto Data, no copy
             "splitStrategy": kwargs.get("split_strategy", "fixed_size"),
             "minChunkSize": kwargs.get("min_chunk_size", 65536),
             "maxChunkSize": kwargs.get("max_chunk_size", 1048576),
@@ -114,6 +132,37 @@ class JobBuilder:
         self.definition.execute_fn = fn
         return self
 
+    def with_numba_execute(
+        self, fn: Callable, signature=None, parallel: bool = False
+    ) -> "JobBuilder":
+        """Set a numeric execute function compiled with Numba.
+
+        fn receives each chunk as a uint8 NumPy array and returns an array
+        (or scalar), which is sent on as its raw bytes. It is compiled with
+        ``numba.njit(cache=True)``, so the machine code is cached on disk
+        and reused by later runs. Without Numba installed fn runs as plain
+        Python. Define fn at module level so the process pool used for
+        local execution can pickle it.
+
+        Args:
+            fn: Function taking and returning NumPy data, in Numba's nopython subset
+            signature: Optional Numba signature for eager compilation
+            parallel: Compile with ``parallel=True`` (for fn using numba.prange)
+        """
+        numba = _numba()
+        if numba is not None:
+            if signature is not None:
+                kernel = numba.njit(signature, cache=True, parallel=parallel)(fn)
+            else:
+                kernel = numba.njit(cache=True, parallel=parallel)(fn)
+        else:
+            logger.warning(
+                f"Numba not installed; {getattr(fn, '__name__', fn)} runs uncompiled"
+            )
+            kernel = fn
+        self.definition.execute_fn = _ArrayExecute(kernel)
+        return self
+
     def with_merge(self, fn: Callable[[List[bytes]], bytes]) -> "JobBuilder":
         """Set the merge function."""
         self.definition.merge_fn = fn
@@ -212,6 +261,23 @@ class Job:
         return fn
 
 
+class _ArrayExecute:
+    """Execute function running a NumPy kernel over a chunk's bytes.
+
+    A class rather than a closure so jobs using it can be pickled for
+    process-pool execution.
+    """
+
+    def __init__(self, kernel: Callable):
+        self.kernel = kernel
+
+    def __call__(self, chunk: bytes) -> bytes:
+        import numpy as np
+
+        result = self.kernel(np.frombuffer(chunk, dtype=np.uint8))
+        return np.asarray(result).tobytes()
+
+
 # Default implementations
 
 
@@ -220,13 +286,25 @@ def default_split(data: bytes, chunk_size: int = 65536) -> List[bytes]:
     return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
 
 
+def split_views(data: bytes, chunk_size: int = 65536) -> List[memoryview]:
+    """Fixed-size split into read-only memoryview slices instead of copies.
+
+    Opt-in alternative to default_split for large inputs, to be called from
+    a custom split function. The execute function then receives memoryviews,
+    so it must accept any buffer (np.frombuffer, hashlib, zlib, ...) or call
+    bytes(chunk) before using bytes methods such as decode().
+    """
+    view = memoryview(data).toreadonly()
+    return [view[i : i + chunk_size] for i in range(0, len(view), chunk_size)]
+
+
 def default_execute(chunk: bytes) -> bytes:
     """Default execute: identity function."""
     return chunk
 
 
 def default_merge(results: List[bytes]) -> bytes:
-    """Default merge: concatenate results."""
+    """Default merge: concatenate results (bytes or memoryview) in one copy."""
     return b"".join(results)
 
 
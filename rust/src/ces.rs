@@ -279,10 +279,14 @@ impl CesPipeline {
 
         let rs =
             ReedSolomon::<reed_solomon_erasure::galois_8::Field>::new(data_shards, parity_shards)?;
-        rs.reconstruct(&mut shards)?;
+        // Only the data shards are read below, so rebuild just the missing
+        // data shards; regenerating missing parity would be thrown away. When
+        // every data shard is present this does no decoding at all.
+        rs.reconstruct_data(&mut shards)?;
 
         // Concatenate data shards
-        let mut result = Vec::new();
+        let shard_len = shards.iter().flatten().map(|s| s.len()).next().unwrap_or(0);
+        let mut result = Vec::with_capacity(shard_len * data_shards);
         for shard_data in shards.iter().take(data_shards).flatten() {
             result.extend_from_slice(shard_data);
         }
@@ -0,0 +1,142 @@
+"""
+In-process stand-in for a Go node, serving NodeService over Cap'n Proto.
+
+Runs a pycapnp server on its own thread and KJ loop so GoNodeClient can
+connect to it over real TCP. Only the methods exercised by the client
+tests are implemented; each handler records its calls in ``calls``.
+"""
+
+import asyncio
+import socket
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+import capnp
+
+SCHEMA_PATH = str(Path(__file__).resolve().parents[2] / "python" / "schema.capnp")
+schema = capnp.load(SCHEMA_PATH)
+
+
+class FakeNodeService(schema.NodeService.Server):
+    """NodeService backed by in-memory nodes and compute jobs."""
+
+    def __init__(self, node):
+        self.node = node
+
+    async def getNode(self, query, _context, **kwargs):
+        node_id = query.nodeId
+        self.node.record("getNode", node_id)
+        await self.node.hold("getNode")
+        _context.results.node = {
+            "id": node_id,
+            "status": 1,
+            "latencyMs": float(node_id),
+            "threatScore": 0.5,
+        }
+
+    async def getAllNodes(self, _context, **kwargs):
+        self.node.record("getAllNodes")
+        _context.results.nodes.init("nodes", 1)
+        _context.results.nodes.nodes[0].id = 1
+
+    async def updateNode(self, update, _context, **kwargs):
+        self.node.record("updateNode", update.nodeId, update.threatScore)
+        _context.results.success = True
+
+    async def sendMessage(self, msg, _context, **kwargs):
+        self.node.record("sendMessage", msg.toPeerId, bytes(msg.data))
+        await self.node.hold("sendMessage")
+        _context.results.success = True
+
+    async def upload(self, request, _context, **kwargs):
+        data = bytes(request.data)
+        self.node.record("upload", data, list(request.targetPeers))
+        response = _context.results.init("response")
+        response.success = True
+        response.manifest.fileSize = len(data)
+
+    async def submitComputeJob(self, manifest, _context, **kwargs):
+        job_id = manifest.jobId
+        self.node.record("submitComputeJob", job_id)
+        await self.node.hold("submitComputeJob")
+        self.node.jobs[job_id] = bytes(manifest.inputData)
+        _context.results.jobId = job_id
+        _context.results.success = True
+
+    async def getComputeJobStatus(self, jobId, _context, **kwargs):
+        self.node.record("getComputeJobStatus", jobId)
+        await self.node.hold("getComputeJobStatus")
+        status = _context.results.init("status")
+        status.jobId = jobId
+        status.status = "running" if jobId in self.node.jobs else "not_found"
+
+
+class FakeGoNode:
+    """
+    Serve FakeNodeService on 127.0.0.1 until stop() is called.
+
+    ``barrier`` maps a method name to a count: calls to that method wait
+    until that many of them are in progress at once, so a test can check
+    that a batch was sent in one round trip (sequential calls would stall
+    on the first one). ``delay`` maps a method name to seconds its calls
+    sleep before answering; other calls are served in the meantime, as a
+    Go node may dispatch them concurrently.
+    """
+
+    def __init__(self):
+        self.calls = defaultdict(list)
+        self.jobs = {}
+        self.barrier = {}
+        self.delay = {}
+        self._waiting = defaultdict(int)
+        self._released = {}
+        self._loop = None
+        self._stop = None
+        self._ready = threading.Event()
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            self.port = probe.getsockname()[1]
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def record(self, method, *args):
+        self.calls[method].append(args)
+
+    async def hold(self, method):
+        if method in self.delay:
+            await asyncio.sleep(self.delay[method])
+        count = self.barrier.get(method)
+        if not count:
+            return
+        self._waiting[method] += 1
+        released = self._released.setdefault(method, asyncio.Event())
+        if self._waiting[method] >= count:
+            released.set()
+        await asyncio.wait_for(released.wait(), timeout=2.0)
+
+    def start(self):
+        self._thread.start()
+        if not self._ready.wait(timeout=5.0):
+            raise RuntimeError("fake Go node failed to start")
+        return self
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(timeout=5.0)
+
+    def _run(self):
+        asyncio.run(capnp.run(self._serve()))
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+
+        async def handle(stream):
+            server = capnp.TwoPartyServer(stream, bootstrap=FakeNodeService(self))
+            await server.on_disconnect()
+
+        server = await capnp.AsyncIoStream.create_server(handle, "127.0.0.1", self.port)
+        async with server:
+            self._ready.set()
+            await self._stop.wait()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Tests for GoNodeClient RPC calls against an in-process node (fake_go_node).
+
+The batch methods pipeline one call per item instead of using a batched
+RPC; the batch tests check that every call of a batch reaches the node
+before any of them is answered, i.e. that a batch costs a single round trip.
+The JPEG helper used by the video senders is tested at the end.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+capnp = pytest.importorskip("capnp")
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "python"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_go_node import SCHEMA_PATH, FakeGoNode  # noqa: E402
+from src.client import go_client  # noqa: E402
+from src.client.go_client import GoNodeClient  # noqa: E402
+
+
+@pytest.fixture
+def node():
+    fake = FakeGoNode().start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture
+def client(node):
+    client = GoNodeClient("127.0.0.1", node.port, SCHEMA_PATH)
+    assert client.connect()
+    yield client
+    client.disconnect()
+
+
+def test_get_nodes_issues_one_round_trip(node, client):
+    # Each getNode is held until all three are in progress on the node
+    node.barrier["getNode"] = 3
+
+    nodes = client.get_nodes([1, 2, 3])
+
+    assert [n["id"] for n in nodes] == [1, 2, 3]
+    assert len(node.calls["getNode"]) == 3
+
+
+def test_get_compute_job_statuses_issues_one_round_trip(node, client):
+    node.barrier["getComputeJobStatus"] = 2
+
+    statuses = client.get_compute_job_statuses(["job-a", "job-b"])
+
+    assert [s["jobId"] for s in statuses] == ["job-a", "job-b"]
+    assert len(node.calls["getComputeJobStatus"]) == 2
+
+
+def test_sequential_calls_do_not_pass_the_barrier(node, client):
+    # Sanity check for the tests above: one call at a time never gets
+    # three in progress, so the node gives up and the lookup fails
+    node.barrier["getNode"] = 3
+
+    assert client.get_node(1) is None
+
+
+def test_connect_timeout_cancels_bootstrap(node, monkeypatch):
+    cancelled = threading.Event()
+
+    async def stalled_open_stream(host, port):
+        try:
+            await go_client.asyncio.sleep(60)
+        finally:
+            cancelled.set()
+
+    monkeypatch.setattr(go_client, "_open_stream", stalled_open_stream)
+    monkeypatch.setattr(go_client, "_CONNECT_TIMEOUT", 0.2)
+    client = GoNodeClient("127.0.0.1", node.port, SCHEMA_PATH)
+
+    assert not client.connect()
+    assert cancelled.wait(timeout=2.0)
+
+
+def test_send_messages_delivers_each_payload(node, client):
+    node.barrier["sendMessage"] = 2
+
+    sent = client.send_messages([(1, b"first"), (2, bytearray(b"second"))])
+
+    assert sent == [True, True]
+    assert node.calls["sendMessage"] == [(1, b"first"), (2, b"second")]
+
+
+def test_update_threat_scores_sends_every_field(node, client):
+    assert client.update_threat_scores([(4, 0.25), (5, 0.75)]) == [True, True]
+    assert client.update_threat_score(6, 0.5)
+
+    assert node.calls["updateNode"] == [(4, 0.25), (5, 0.75), (6, 0.5)]
+
+
+def test_upload_writes_buffer_views_into_the_request(node, client):
+    data = bytearray(range(256)) * 64
+
+    manifest = client.upload(memoryview(data)[16:], [7, 8])
+
+    assert manifest["fileSize"] == len(data) - 16
+    assert node.calls["upload"] == [(bytes(data[16:]), [7, 8])]
+
+
+@pytest.mark.parametrize("by_field", [True, False])
+def test_struct_readers_convert_with_and_without_get_by_field(
+    node, client, monkeypatch, by_field
+):
+    monkeypatch.setattr(go_client, "_HAS_GET_BY_FIELD", by_field)
+
+    assert client.get_node(2) == {
+        "id": 2,
+        "status": 1,
+        "latencyMs": 2.0,
+        "threatScore": 0.5,
+    }
+    statuses = client.get_compute_job_statuses(["job-a", "job-b"])
+    assert [s["jobId"] for s in statuses] == ["job-a", "job-b"]
+    assert statuses[0]["status"] == "not_found"
+
+
+@pytest.mark.parametrize("coalesce", [True, False])
+def test_connect_with_and_without_coalescing_transport(node, monkeypatch, coalesce):
+    wrapped = []
+
+    class RecordingTransport(go_client._CoalescingTransport):
+        def __init__(self, transport, loop):
+            super().__init__(transport, loop)
+            wrapped.append(self)
+
+    monkeypatch.setattr(go_client, "_CoalescingTransport", RecordingTransport)
+    if not coalesce:
+        # pycapnp build without the private protocol class
+        monkeypatch.delattr(capnp.lib.capnp, "_PyAsyncIoStreamProtocol")
+
+    client = GoNodeClient("127.0.0.1", node.port, SCHEMA_PATH)
+    assert client.connect()
+    try:
+        assert [n["id"] for n in client.get_nodes([1, 2])] == [1, 2]
+    finally:
+        client.disconnect()
+    assert len(wrapped) == (1 if coalesce else 0)
+
+
+def test_coalescing_transport_merges_writes_of_one_iteration():
+    class Sink:
+        def __init__(self):
+            self.writes = []
+
+        def write(self, data):
+            self.writes.append(data)
+
+        def is_closing(self):
+            return False
+
+    loop = asyncio.new_event_loop()
+    try:
+        sink = Sink()
+        transport = go_client._CoalescingTransport(sink, loop)
+        transport.write(b"segment table")
+        transport.write(b"segment")
+        assert sink.writes == []
+
+        loop.run_until_complete(asyncio.sleep(0))
+        assert sink.writes == [b"segment tablesegment"]
+
+        transport.write(b"x" * go_client._CAPNP_BUF_BYTES)
+        assert len(sink.writes) == 2
+    finally:
+        loop.close()
+
+
+def test_call_nowait_on_the_loop_fails_fast_when_full(client):
+    for _ in range(go_client._MAX_INFLIGHT_SENDS):
+        client._inflight_sends.acquire()
+
+    async def send():
+        return True
+
+    async def call_nowait_on_loop():
+        start = time.monotonic()
+        queued = client._call_nowait(send(), "Error sending")
+        return queued, time.monotonic() - start
+
+    try:
+        queued, elapsed = client._call(call_nowait_on_loop(), 5.0, None, "error")
+    finally:
+        for _ in range(go_client._MAX_INFLIGHT_SENDS):
+            client._inflight_sends.release()
+
+    assert queued is False
+    assert elapsed < 0.5
+
+
+def test_send_message_nowait_accepts_buffers(node, client):
+    client.send_message_nowait(3, bytearray(b"queued"))
+    client.send_message_nowait(4, memoryview(b"also queued"))
+
+    deadline = time.monotonic() + 2.0
+    while len(node.calls["sendMessage"]) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert node.calls["sendMessage"] == [(3, b"queued"), (4, b"also queued")]
+
+
+def test_submit_with_status_waits_for_the_submission(node, client):
+    # Without the wait, the status call would be answered before the job
+    # is registered and report it as not found
+    node.delay["submitComputeJob"] = 0.1
+
+    success, error, status = client.submit_compute_job_with_status(
+        "job-1", bytearray(b"input")
+    )
+
+    assert (success, error) == (True, "")
+    assert status["jobId"] == "job-1"
+    assert status["status"] == "running"
+    assert node.jobs == {"job-1": b"input"}
+
+
+def test_submit_compute_jobs_writes_each_manifest(node, client):
+    node.barrier["submitComputeJob"] = 2
+    data = bytearray(b"0123456789")
+
+    results = client.submit_compute_jobs(
+        [
+            {"job_id": "job-a", "input_data": memoryview(data)[:5]},
+            {"job_id": "job-b", "input_data": bytes(data[5:]), "priority": 9},
+        ]
+    )
+
+    assert results == [(True, ""), (True, "")]
+    assert node.jobs == {"job-a": b"01234", "job-b": b"56789"}
+
+
+def test_turbojpeg_frames_use_the_same_subsampling_as_opencv(monkeypatch):
+    turbojpeg = types.ModuleType("turbojpeg")
+    turbojpeg.TJSAMP_420 = 2
+    monkeypatch.setitem(sys.modules, "turbojpeg", turbojpeg)
+    encodes = []
+
+    class Encoder:
+        def encode(self, frame, **kwargs):
+            encodes.append(kwargs)
+            return b"jpeg"
+
+    monkeypatch.setattr(go_client, "_turbojpeg", Encoder)
+
+    assert go_client._encode_jpeg(object(), 70) == b"jpeg"
+    assert encodes == [{"quality": 70, "jpeg_subsample": turbojpeg.TJSAMP_420}]
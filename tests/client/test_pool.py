@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Tests for GoNodeClientPool routing, method forwarding and disconnect().
+
+Most tests replace the pooled clients with StubClient, a GoNodeClient that
+records calls instead of talking to a Go node, so no node or event loop is
+needed. The cache and ordering tests connect real clients to fake_go_node.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("capnp")
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "python"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_go_node import SCHEMA_PATH, FakeGoNode  # noqa: E402
+from src.client import pool as pool_module  # noqa: E402
+from src.client.go_client import GoNodeClient  # noqa: E402
+from src.client.pool import GoNodeClientPool  # noqa: E402
+
+
+class StubClient(GoNodeClient):
+    """GoNodeClient that records blocking calls instead of running RPCs."""
+
+    fail_connect = False
+
+    def __init__(self, host, port, schema_path=None, loop_index=0):
+        super().__init__(host, port, schema_path, loop_index)
+        self.calls = []
+        self.disconnects = 0
+        # upload() waits on the event stored under its data, if any
+        self.holds = {}
+
+    def connect(self):
+        self._connected = not self.fail_connect
+        return self._connected
+
+    def disconnect(self):
+        self.disconnects += 1
+        self._connected = False
+
+    def get_node(self, node_id):
+        self.calls.append(("get_node", node_id, threading.get_ident()))
+        return {"id": node_id}
+
+    def upload(self, data, target_peers):
+        self.calls.append(("upload", data, threading.get_ident()))
+        hold = self.holds.get(data)
+        if hold is not None:
+            assert hold.wait(timeout=2.0)
+        return {"fileSize": len(data)}
+
+
+def make_pool(monkeypatch, size, free_threaded=False):
+    monkeypatch.setattr(pool_module, "GoNodeClient", StubClient)
+    monkeypatch.setattr(pool_module, "_FREE_THREADED", free_threaded)
+    return GoNodeClientPool("127.0.0.1", 8080, size=size)
+
+
+def test_regular_calls_round_robin(monkeypatch):
+    pool = make_pool(monkeypatch, size=3)
+
+    for node_id in range(6):
+        assert pool.get_node(node_id) == {"id": node_id}
+
+    assert [[c[1] for c in client.calls] for client in pool._clients] == [
+        [0, 3],
+        [1, 4],
+        [2, 5],
+    ]
+
+
+def test_free_threaded_calls_stay_on_the_callers_client(monkeypatch):
+    pool = make_pool(monkeypatch, size=2, free_threaded=True)
+    assert [client.loop_index for client in pool._clients] == [0, 1]
+
+    # Both threads stay alive together, so their idents are distinct
+    started = threading.Barrier(2)
+
+    def call_three_times():
+        started.wait(timeout=2.0)
+        for node_id in range(3):
+            pool.get_node(node_id)
+
+    threads = [threading.Thread(target=call_three_times) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    callers = [{c[2] for c in client.calls} for client in pool._clients]
+    assert [len(client.calls) for client in pool._clients] == [3, 3]
+    assert all(len(threads_seen) == 1 for threads_seen in callers)
+    assert callers[0] != callers[1]
+
+
+def test_bulk_calls_go_to_the_least_busy_client(monkeypatch):
+    pool = make_pool(monkeypatch, size=2)
+    busy = pool._clients[0]
+    release = busy.holds[b"large"] = threading.Event()
+
+    worker = threading.Thread(target=pool.upload, args=(b"large", [1]))
+    worker.start()
+    while not busy.calls:
+        pass
+
+    # Round-robin would pick client 0 next; it is still busy with the upload
+    pool.get_node(0)
+    assert pool.upload(b"small", [1]) == {"fileSize": 5}
+    assert [c[:2] for c in pool._clients[1].calls] == [("upload", b"small")]
+
+    release.set()
+    worker.join()
+    assert pool._bulk_outstanding == [0, 0]
+
+
+def test_only_public_blocking_methods_are_forwarded(monkeypatch):
+    pool = make_pool(monkeypatch, size=1)
+
+    assert pool.get_node(1) == {"id": 1}
+    for name in ("get_node_async", "_call", "schema", "no_such_method"):
+        with pytest.raises(AttributeError):
+            getattr(pool, name)
+    assert pool._clients[0].calls[0][:2] == ("get_node", 1)
+
+
+def test_connect_and_disconnect_every_client(monkeypatch):
+    pool = make_pool(monkeypatch, size=3)
+
+    assert pool.connect()
+    assert pool.is_connected()
+
+    pool.disconnect()
+    assert not pool.is_connected()
+    assert [client.disconnects for client in pool._clients] == [1, 1, 1]
+
+    # Already disconnected clients are skipped
+    pool.disconnect()
+    assert [client.disconnects for client in pool._clients] == [1, 1, 1]
+
+
+def test_failed_connect_disconnects_connected_clients(monkeypatch):
+    pool = make_pool(monkeypatch, size=3)
+    pool._clients[1].fail_connect = True
+
+    assert not pool.connect()
+    assert not pool.is_connected()
+    assert [client.disconnects for client in pool._clients] == [1, 0, 0]
+
+
+@pytest.fixture
+def node():
+    fake = FakeGoNode().start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture
+def connected_pool(node, monkeypatch):
+    monkeypatch.setattr(pool_module, "_FREE_THREADED", False)
+    pool = GoNodeClientPool("127.0.0.1", node.port, SCHEMA_PATH, size=2)
+    assert pool.connect()
+    yield pool
+    pool.disconnect()
+
+
+def test_write_through_one_client_invalidates_reads_on_another(node, connected_pool):
+    reader, writer = connected_pool._clients
+
+    assert reader.get_all_nodes()
+    assert reader.get_all_nodes()
+    assert len(node.calls["getAllNodes"]) == 1
+
+    assert writer.update_threat_score(1, 0.9)
+    assert reader.get_all_nodes()
+    assert len(node.calls["getAllNodes"]) == 2
+
+
+def test_nowait_sends_stay_on_one_client_in_order(node, connected_pool):
+    for i in range(6):
+        connected_pool.send_message_nowait(7, bytes([i]))
+
+    deadline = time.monotonic() + 2.0
+    while len(node.calls["sendMessage"]) < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert node.calls["sendMessage"] == [(7, bytes([i])) for i in range(6)]
+    assert (
+        connected_pool.send_message_nowait
+        == connected_pool._clients[0].send_message_nowait
+    )
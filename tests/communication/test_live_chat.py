@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the reference chat loop's handling of received data.
+
+The peer is the other end of a local socket and stdin is a pipe that is
+left open, so chat_loop only returns once the peer side ends.
+"""
+
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "python"))
+
+from src.communication.live_chat import chat_loop  # noqa: E402
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="chat_loop selects on stdin"
+)
+
+
+class PipeStdin:
+    def __init__(self, fd):
+        self._fd = fd
+
+    def fileno(self):
+        return self._fd
+
+
+@pytest.fixture
+def stdin(monkeypatch):
+    read_fd, write_fd = os.pipe()
+    monkeypatch.setattr(sys, "stdin", PipeStdin(read_fd))
+    yield
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def tcp_pair():
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        peer = socket.create_connection(server.getsockname())
+        sock, _ = server.accept()
+    return sock, peer
+
+
+def run_chat_loop(sock):
+    thread = threading.Thread(target=chat_loop, args=(sock,))
+    thread.start()
+    return thread
+
+
+def test_character_split_across_reads_is_decoded(stdin, capsys):
+    sock, peer = tcp_pair()
+    peer.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    encoded = "héllo".encode("utf-8")
+
+    thread = run_chat_loop(sock)
+    # "é" is two bytes; the first read ends in the middle of it
+    peer.sendall(encoded[:2])
+    time.sleep(0.2)
+    peer.sendall(encoded[2:])
+    time.sleep(0.2)
+    peer.close()
+    thread.join(timeout=2.0)
+    sock.close()
+
+    assert not thread.is_alive()
+    out = capsys.readouterr().out
+    received = [
+        line.split("📨 Peer: ", 1)[1] for line in out.splitlines() if "📨" in line
+    ]
+    assert "".join(received) == "héllo"
+    assert "[Peer disconnected]" in out
+
+
+def test_connection_reset_ends_the_loop(stdin, capsys):
+    sock, peer = tcp_pair()
+    # Closing with a zero linger time sends a reset instead of a FIN
+    peer.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+
+    thread = run_chat_loop(sock)
+    peer.close()
+    thread.join(timeout=2.0)
+    sock.close()
+
+    assert not thread.is_alive()
+    assert "[Peer disconnected]" in capsys.readouterr().out
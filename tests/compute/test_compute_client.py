@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Tests for ComputeClient's local fallback execution and job bookkeeping.
+
+The Go node is replaced by a stub object, so no orchestrator is needed.
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "python"))
+
+from src.compute import client as client_module  # noqa: E402
+from src.compute.client import ComputeClient, TaskStatus  # noqa: E402
+from src.compute import job as job_module  # noqa: E402
+from src.compute.job import JobBuilder, JobDefinition  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    client = ComputeClient()
+    yield client
+    client.disconnect()
+
+
+def upper_in_main(chunk):
+    return chunk.upper()
+
+
+upper_in_main.__module__ = "__main__"
+
+
+def test_picklable_mapper_runs_on_a_spawned_pool(client):
+    definition = JobDefinition("upper", execute_fn=bytes.upper)
+
+    results = client._map_chunks(definition, [b"ab", memoryview(b"cd"), b"ef"])
+
+    assert list(results) == [b"AB", b"CD", b"EF"]
+    assert client._pool is not None
+    assert client._pool._mp_context.get_start_method() == "spawn"
+
+
+@pytest.mark.parametrize("execute_fn", [lambda chunk: chunk.upper(), upper_in_main])
+def test_unloadable_mappers_run_in_process(client, execute_fn):
+    definition = JobDefinition("upper", execute_fn=execute_fn)
+
+    results = client._map_chunks(definition, [b"ab", b"cd"])
+
+    assert list(results) == [b"AB", b"CD"]
+    assert client._pool is None
+
+
+def double_in_main(values):
+    return values * 2
+
+
+double_in_main.__module__ = "__main__"
+
+
+class FakeDispatcher:
+    """Picklable stand-in for a Numba dispatcher wrapping py_func."""
+
+    def __init__(self, py_func):
+        self.py_func = py_func
+
+    def __call__(self, *args):
+        return self.py_func(*args)
+
+
+class FakeNumba:
+    @staticmethod
+    def njit(*args, **kwargs):
+        return FakeDispatcher
+
+
+@pytest.mark.parametrize("numba", [None, FakeNumba], ids=["plain", "dispatcher"])
+def test_numba_kernels_from_main_run_in_process(client, monkeypatch, numba):
+    pytest.importorskip("numpy")
+    # Findable in __main__, so the wrapped kernel pickles by reference
+    monkeypatch.setattr(
+        sys.modules["__main__"], "double_in_main", double_in_main, raising=False
+    )
+    monkeypatch.setattr(job_module, "_numba", lambda: numba)
+    # A real pool would break and fall back too; the kernel must never reach one
+    monkeypatch.setattr(client_module, "ProcessPoolExecutor", FakePool)
+    monkeypatch.setattr(FakePool, "created", 0)
+    definition = JobBuilder("double").with_numba_execute(double_in_main).build()
+
+    results = client._map_chunks(definition, [b"\x01", b"\x02"])
+
+    assert list(results) == [b"\x02", b"\x04"]
+    assert FakePool.created == 0
+
+
+class FakePool:
+    """In-process stand-in for ProcessPoolExecutor that counts instances."""
+
+    created = 0
+    broken = False
+
+    def __init__(self, max_workers, mp_context):
+        type(self).created += 1
+        # Widen the window in which a second caller could also create one
+        time.sleep(0.05)
+
+    def map(self, fn, chunks, chunksize=1):
+        if self.broken:
+            raise BrokenProcessPool("worker died")
+        return map(fn, chunks)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def test_concurrent_fallbacks_create_one_pool(client, monkeypatch):
+    monkeypatch.setattr(client_module, "ProcessPoolExecutor", FakePool)
+    monkeypatch.setattr(FakePool, "created", 0)
+    definition = JobDefinition("upper", execute_fn=bytes.upper)
+
+    threads = [
+        threading.Thread(target=client._map_chunks, args=(definition, [b"a", b"b"]))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert FakePool.created == 1
+
+
+def test_broken_pool_falls_back_in_process(client, monkeypatch):
+    monkeypatch.setattr(client_module, "ProcessPoolExecutor", FakePool)
+    monkeypatch.setattr(FakePool, "broken", True)
+    definition = JobDefinition("upper", execute_fn=bytes.upper)
+
+    results = client._map_chunks(definition, [b"ab", b"cd"])
+
+    assert list(results) == [b"AB", b"CD"]
+    assert client._pool is None
+
+
+class StubGoClient:
+    """GoNodeClient stand-in that accepts or rejects every submission."""
+
+    def __init__(self, accept):
+        self.accept = accept
+        self.submitted = []
+        # Go status strings returned by get_compute_job_status, by job ID
+        self.statuses = {}
+
+    def submit_compute_jobs(self, requests):
+        self.submitted.extend(requests)
+        return [(self.accept, "" if self.accept else "rejected")] * len(requests)
+
+    def get_compute_job_status(self, job_id):
+        if job_id not in self.statuses:
+            return None
+        return {
+            "status": self.statuses[job_id],
+            "progress": 1.0,
+            "completedChunks": 1,
+            "totalChunks": 1,
+            "estimatedTimeRemaining": 0,
+            "errorMsg": "",
+        }
+
+    def get_compute_job_result(self, job_id, timeout_ms=60000):
+        return None, "orchestrator unavailable", ""
+
+    def disconnect(self):
+        pass
+
+
+def connect_stub(client, accept):
+    client._go_client = StubGoClient(accept)
+    client._connected = True
+    return client._go_client
+
+
+class RecordingJob(JobDefinition):
+    """JobDefinition that records every split, i.e. every local execution."""
+
+    def split(self, data):
+        self.metadata.setdefault("splits", []).append(bytes(data))
+        return super().split(data)
+
+
+def test_finished_jobs_expire_after_the_ttl(client):
+    connect_stub(client, accept=False)
+    client.set_job_ttl(0.05)
+
+    job_id = client.submit_job(JobDefinition("upper", execute_fn=bytes.upper), b"a")
+    assert client.get_status(job_id).status == TaskStatus.COMPLETED
+    assert client.get_result(job_id) == (b"A", "local")
+
+    time.sleep(0.1)
+    with pytest.raises(KeyError):
+        client.get_status(job_id)
+    assert client.list_jobs() == []
+    assert client._completions == {} and client._finished == {}
+
+
+def test_running_jobs_are_not_evicted(client):
+    go_client = connect_stub(client, accept=True)
+    client.set_job_ttl(0)
+
+    running = client.submit_job(JobDefinition("remote"), b"remote input")
+    go_client.accept = False
+    finished = client.submit_job(JobDefinition("local"), b"local input")
+
+    time.sleep(0.01)
+    # Eviction runs before the next submission is registered
+    latest = client.submit_job(JobDefinition("local"), b"more input")
+
+    assert client.list_jobs() == [running, latest]
+    assert finished not in client._completions
+    assert client.get_status(running).status == TaskStatus.ASSIGNED
+
+
+def test_remote_jobs_seen_finished_by_get_status_expire(client):
+    go_client = connect_stub(client, accept=True)
+    client.set_job_ttl(0.05)
+
+    job_id = client.submit_job(JobDefinition("remote"), b"input")
+    go_client.statuses[job_id] = "computing"
+    assert client.get_status(job_id).status == TaskStatus.COMPUTING
+    time.sleep(0.1)
+    assert client.list_jobs() == [job_id]
+
+    go_client.statuses[job_id] = "COMPLETED"
+    assert client.get_status(job_id).status == TaskStatus.COMPLETED
+    time.sleep(0.1)
+    with pytest.raises(KeyError):
+        client.get_status(job_id)
+
+
+def test_local_completion_is_signalled_before_the_ttl_starts(client, monkeypatch):
+    connect_stub(client, accept=False)
+    mark_finished = client._mark_finished
+    signalled = []
+
+    def check_signalled(job_id):
+        # Once marked, eviction on another thread may drop the event
+        signalled.append(client._completions[job_id].is_set())
+        mark_finished(job_id)
+
+    monkeypatch.setattr(client, "_mark_finished", check_signalled)
+    client.submit_job(JobDefinition("upper", execute_fn=bytes.upper), b"a")
+
+    assert signalled == [True]
+
+
+def test_accepted_jobs_drop_their_input_and_never_run_locally(client):
+    go_client = connect_stub(client, accept=True)
+    definition = RecordingJob("upper", execute_fn=bytes.upper)
+
+    job_id = client.submit_job(definition, b"input")
+
+    assert go_client.submitted[0]["input_data"] == b"input"
+    assert "inputData" not in client._jobs[job_id]["manifest"]
+
+    # The orchestrator failing to return a result does not fall back to a
+    # local run, which would need the dropped input
+    with pytest.raises(TimeoutError):
+        client.get_result(job_id, timeout=0.05)
+    assert "splits" not in definition.metadata
+    assert client._jobs[job_id]["status"] == TaskStatus.ASSIGNED
+
+    # Cancelling still finishes the job without touching its input
+    client._go_client.cancel_compute_job = lambda job_id: True
+    assert client.cancel_job(job_id)
+    with pytest.raises(RuntimeError, match="cancelled"):
+        client.get_result(job_id, timeout=0.05)
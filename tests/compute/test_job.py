@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the default split function, the opt-in memoryview splitter and
+the lazily imported Numba support.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PYTHON_DIR = Path(__file__).parent.parent.parent / "python"
+sys.path.insert(0, str(PYTHON_DIR))
+
+from src.compute import job as job_module  # noqa: E402
+from src.compute.job import (  # noqa: E402
+    JobBuilder,
+    create_parallel_process_job,
+    default_split,
+    split_views,
+)
+
+
+def test_default_split_returns_bytes_chunks():
+    chunks = default_split(b"abcdefg", chunk_size=3)
+
+    assert chunks == [b"abc", b"def", b"g"]
+    assert all(type(chunk) is bytes for chunk in chunks)
+
+
+def test_map_reduce_job_mappers_can_use_bytes_methods():
+    job = create_parallel_process_job("upper", lambda chunk: chunk.upper(), 4)
+
+    chunks = job.split(b"hello world")
+    assert job.merge([job.execute(chunk) for chunk in chunks]) == b"HELLO WORLD"
+
+
+def test_split_views_slices_without_copying():
+    data = bytearray(b"abcdefg")
+
+    views = split_views(data, chunk_size=3)
+
+    assert [bytes(view) for view in views] == [b"abc", b"def", b"g"]
+    assert all(view.readonly for view in views)
+    data[0:1] = b"z"
+    assert bytes(views[0]) == b"zbc"
+
+
+def double(values):
+    return values * 2
+
+
+def test_importing_compute_does_not_import_numba():
+    code = "import sys, src.compute; print('numba' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PYTHON_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_with_numba_execute_imports_numba_on_first_use(monkeypatch):
+    pytest.importorskip("numpy")
+    imports = []
+    monkeypatch.setattr(job_module, "_numba", lambda: imports.append("numba"))
+
+    JobBuilder("plain").with_execute(bytes.upper).build()
+    assert imports == []
+
+    # _numba() returning None means Numba is missing: fn runs uncompiled
+    job = JobBuilder("double").with_numba_execute(double).build()
+    assert imports == ["numba"]
+    assert job.execute(b"\x01\x02") == b"\x02\x04"